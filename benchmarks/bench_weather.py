@@ -0,0 +1,160 @@
+"""Scaling benchmarks for the weather module.
+
+Generates synthetic csv files in the same format as tests/data, times each
+public function at several sizes and reports seconds, rows/s and peak memory.
+
+    python benchmarks/bench_weather.py --sizes 1000 100000 --save results.json
+    python benchmarks/bench_weather.py --baseline results.json --threshold 0.2
+
+With --baseline, any benchmark that is slower than the baseline by more than
+the threshold is reported and the exit code is 1.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def write_synthetic_csv(path, rows, seed=0):
+    """Writes a deterministic csv file shaped like the files in tests/data.
+
+    Each day has 24 hourly readings, starting on 1 January 1900, so even 1e7
+    rows stay within datetime's range. Minimums run from -60 to 100 and
+    maximums are 0 to 40 degrees above them, so negative values are common.
+
+    Args:
+        path: Where to write the file.
+        rows: The number of data rows.
+        seed: Seed for the temperature generator.
+    """
+    rng = random.Random(seed)
+    hours = [f"T{hour:02d}:00:00+08:00," for hour in range(24)]
+    start = date(1900, 1, 1)
+    with open(path, "w", newline="") as csv_file:
+        csv_file.write("date,min,max\n")
+        written = 0
+        while written < rows:
+            count = min(100_000, rows - written)
+            lows = rng.choices(range(-60, 101), k=count)
+            spreads = rng.choices(range(0, 41), k=count)
+            lines = []
+            for i in range(count):
+                row = written + i
+                if row % 24 == 0:
+                    day = (start + timedelta(days=row // 24)).isoformat()
+                lines.append(f"{day}{hours[row % 24]}{lows[i]},{lows[i] + spreads[i]}\n")
+            csv_file.write("".join(lines))
+            written += count
+
+
+def _consume(iterator):
+    for _ in iterator:
+        pass
+
+
+BENCHMARKS = {
+    "load_data_from_csv": lambda path: weather.load_data_from_csv(path),
+    "iter_data_from_csv": lambda path: _consume(weather.iter_data_from_csv(path)),
+    "load_table_from_csv": lambda path: weather.load_table_from_csv(path),
+    "generate_summary": lambda path: weather.generate_summary(weather.iter_data_from_csv(path)),
+    "generate_summary_table": lambda path: weather.generate_summary(weather.load_table_from_csv(path)),
+    "generate_summary_from_csv": lambda path: weather.generate_summary_from_csv(path),
+    "generate_daily_summary": lambda path: weather.generate_daily_summary(weather.iter_data_from_csv(path)),
+    "write_daily_summary": lambda path: weather.write_daily_summary(weather.iter_data_from_csv(path), io.StringIO()),
+}
+
+
+def run_benchmark(function, path, rows, repeat=1, measure_memory=True):
+    """Times one benchmark on one file.
+
+    Returns:
+        A dictionary with the best time of `repeat` runs, rows per second and,
+        unless measure_memory is False, the peak traced memory of one more run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(path)
+        best = min(best, time.perf_counter() - started)
+    result = {"rows": rows, "seconds": best, "rows_per_second": rows / best if best else 0.0}
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            function(path)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Finds benchmarks that got slower than the baseline by more than threshold.
+
+    Returns:
+        A list of (name, rows, baseline seconds, new seconds) tuples.
+    """
+    previous = {(entry["name"], entry["rows"]): entry["seconds"] for entry in baseline["results"]}
+    regressions = []
+    for entry in results["results"]:
+        before = previous.get((entry["name"], entry["rows"]))
+        if before is not None and entry["seconds"] > before * (1 + threshold):
+            regressions.append((entry["name"], entry["rows"], before, entry["seconds"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="row counts to benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory run")
+    parser.add_argument("--data-dir", help="keep generated csv files here and reuse them")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results saved earlier with --save")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    names = args.only or list(BENCHMARKS)
+    results = {"python": platform.python_version(), "machine": platform.machine(), "results": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        os.makedirs(data_dir, exist_ok=True)
+        for rows in args.sizes:
+            path = os.path.join(data_dir, f"synthetic_{rows}.csv")
+            if not os.path.exists(path):
+                write_synthetic_csv(path, rows)
+            for name in names:
+                entry = {"name": name}
+                entry.update(run_benchmark(BENCHMARKS[name], path, rows, args.repeat, not args.no_memory))
+                results["results"].append(entry)
+                peak = f"{entry['peak_bytes'] / 1e6:10.1f} MB" if "peak_bytes" in entry else ""
+                print(f"{name:28} {rows:>10} rows {entry['seconds']:10.4f}s "
+                      f"{entry['rows_per_second']:14,.0f} rows/s {peak}", flush=True)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf8") as results_file:
+            json.dump(results, results_file, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf8") as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        for name, rows, before, after in regressions:
+            print(f"REGRESSION {name} at {rows} rows: {before:.4f}s -> {after:.4f}s", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,10 +10,11 @@ class Cow():
         print(self)
         print("MOO!")
 
-# bessie = Cow()
-bessie = Cow("Bessie", "Brown")
-# print(f"Bessie the cow eats {bessie.diet}")
-# print("Say something Bessie!")
-# bessie.speak()
-print(f"This cow's name is {bessie.name}.")
-print(f"{bessie.name} is {bessie.colour}")
\ No newline at end of file
+if __name__ == "__main__":
+    # bessie = Cow()
+    bessie = Cow("Bessie", "Brown")
+    # print(f"Bessie the cow eats {bessie.diet}")
+    # print("Say something Bessie!")
+    # bessie.speak()
+    print(f"This cow's name is {bessie.name}.")
+    print(f"{bessie.name} is {bessie.colour}")
\ No newline at end of file
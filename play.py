@@ -1,4 +1,7 @@
 import csv
+import os
+import tempfile
+
 def load_data_from_csv(csv_file):
     data_list = []
     with open(csv_file, 'r', newline='') as csv_file:
@@ -26,5 +29,11 @@ dataset = """date,min,max
 2020-06-26T07:00:00+08:00,53,66
 """
 
-# Print the result directly
-print(load_data_from_csv(dataset))
+if __name__ == "__main__":
+    # load_data_from_csv takes a file path, so write the dataset to a temporary file first
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as temp_file:
+        temp_file.write(dataset)
+    try:
+        print(load_data_from_csv(temp_file.name))
+    finally:
+        os.remove(temp_file.name)
@@ -0,0 +1,9 @@
+import random
+from datetime import date, timedelta
+
+
+def make_days(count, seed, lows=(30, 45), highs=(50, 60), start=date(2021, 1, 1)):
+    """Returns count consecutive days of random whole-degree weather data, using a private random generator."""
+    rng = random.Random(seed)
+    return [[f"{start + timedelta(days=i)}T07:00:00+08:00", rng.randint(*lows), rng.randint(*highs)]
+            for i in range(count)]
@@ -0,0 +1,116 @@
+import csv
+import glob
+import io
+import json
+import os
+import tempfile
+import unittest
+import weather
+
+
+class BatchCLITests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_batch_to_stdout(self):
+        out = io.StringIO()
+        err = io.StringIO()
+        exit_code = weather.main(["batch", "tests/data", "--workers", "1"], out=out, err=err)
+        self.assertEqual(exit_code, 0)
+        for example in ["one", "two", "three"]:
+            with open(f"tests/expected_output/example_{example}_summary.txt", encoding="utf8") as txt_file:
+                expected_result = txt_file.read()
+            self.assertIn(f"==> tests/data/example_{example}.csv <==\n{expected_result}", out.getvalue())
+        self.assertIn("3 files, 21 rows", err.getvalue())
+        self.assertIn("files/s", err.getvalue())
+        self.assertIn("p99", err.getvalue())
+
+    def test_batch_to_output_dir_with_workers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            err = io.StringIO()
+            exit_code = weather.main(["batch", "tests/data/example_*.csv", "--workers", "2", "--chunk-size", "1",
+                                      "--daily", "--output-dir", tmp], out=io.StringIO(), err=err)
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(sorted(os.listdir(tmp)), [f"example_{example}_daily_summary.txt" for example in ["one", "three", "two"]])
+            for example in ["one", "two", "three"]:
+                with open(f"tests/expected_output/example_{example}_daily_summary.txt", encoding="utf8") as txt_file:
+                    expected_result = txt_file.read()
+                with open(os.path.join(tmp, f"example_{example}_daily_summary.txt"), encoding="utf8") as txt_file:
+                    self.assertEqual(expected_result, txt_file.read())
+
+    def test_batch_jsonl_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            exit_code = weather.main(["batch", "tests/data", "--workers", "1", "--format", "jsonl",
+                                      "--output-dir", tmp], out=io.StringIO(), err=io.StringIO())
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(sorted(os.listdir(tmp)), [f"example_{example}_summary.jsonl" for example in ["one", "three", "two"]])
+            with open(os.path.join(tmp, "example_one_summary.jsonl"), encoding="utf8") as jsonl_file:
+                self.assertIn('"lowest_c": 9.4', jsonl_file.read())
+
+    def test_batch_machine_formats_to_stdout(self):
+        out = io.StringIO()
+        exit_code = weather.main(["batch", "tests/data", "--workers", "1", "--format", "jsonl"],
+                                 out=out, err=io.StringIO())
+        self.assertEqual(exit_code, 0)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([record["file"] for record in records],
+                         [f"tests/data/example_{example}.csv" for example in ["one", "three", "two"]])
+        self.assertEqual(records[0]["lowest_c"], 9.4)
+
+        out = io.StringIO()
+        exit_code = weather.main(["batch", "tests/data", "--workers", "2", "--chunk-size", "1", "--daily",
+                                  "--format", "csv"], out=out, err=io.StringIO())
+        self.assertEqual(exit_code, 0)
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0], ["file", "date", "min_c", "max_c"])
+        self.assertEqual(len(rows), 1 + 21)
+        self.assertEqual(sorted(set(row[0] for row in rows[1:])),
+                         [f"tests/data/example_{example}.csv" for example in ["one", "three", "two"]])
+
+    def test_batch_refuses_duplicate_output_names(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for directory in ["a", "b"]:
+                os.makedirs(os.path.join(tmp, directory))
+                with open(os.path.join(tmp, directory, "x.csv"), "w") as csv_file:
+                    csv_file.write("date,min,max\n2021-07-02T07:00:00+08:00,49,67\n")
+            output_dir = os.path.join(tmp, "out")
+            err = io.StringIO()
+            exit_code = weather.main(["batch", os.path.join(glob.escape(tmp), "**", "*.csv"), "--workers", "1",
+                                      "--output-dir", output_dir], out=io.StringIO(), err=err)
+            self.assertEqual(exit_code, 1)
+            self.assertIn("would both be written to x_summary.txt", err.getvalue())
+            self.assertFalse(os.path.exists(output_dir))
+
+    def test_batch_reports_failures(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "broken.csv"), "w") as csv_file:
+                csv_file.write("date,min,max\n2021-07-02T07:00:00+08:00,cold,67\n")
+            err = io.StringIO()
+            exit_code = weather.main(["batch", tmp, "--workers", "1"], out=io.StringIO(), err=err)
+            self.assertEqual(exit_code, 1)
+            self.assertIn("broken.csv", err.getvalue())
+            self.assertIn("1 failed", err.getvalue())
+
+    def test_batch_reports_csv_errors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "huge_field.csv"), "w") as csv_file:
+                csv_file.write('date,min,max\n"' + "x" * 200000 + '",49,67\n')
+            for example in ["one", "two"]:
+                with open(f"tests/data/example_{example}.csv", encoding="utf8") as source:
+                    with open(os.path.join(tmp, f"example_{example}.csv"), "w") as csv_file:
+                        csv_file.write(source.read())
+            out = io.StringIO()
+            err = io.StringIO()
+            exit_code = weather.main(["batch", tmp, "--workers", "1"], out=out, err=err)
+            self.assertEqual(exit_code, 1)
+            self.assertIn("huge_field.csv", err.getvalue())
+            self.assertIn("1 failed", err.getvalue())
+            self.assertIn("example_two.csv <==", out.getvalue())
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(weather.core._percentile(values, 0.50), 50)
+        self.assertEqual(weather.core._percentile(values, 0.99), 99)
+        self.assertEqual(weather.core._percentile([7], 0.99), 7)
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+import weather
+from benchmarks import bench_weather
+
+
+class BenchmarkTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_synthetic_csv_is_deterministic_and_loadable(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = os.path.join(tmp, "first.csv")
+            second = os.path.join(tmp, "second.csv")
+            bench_weather.write_synthetic_csv(first, 500, seed=4)
+            bench_weather.write_synthetic_csv(second, 500, seed=4)
+            with open(first, "rb") as one, open(second, "rb") as two:
+                self.assertEqual(one.read(), two.read())
+            data = weather.load_data_from_csv(first)
+            self.assertEqual(len(data), 500)
+            self.assertEqual(data[25][0], "1900-01-02T01:00:00+08:00")
+            self.assertTrue(any(day[1] < 0 for day in data))
+            self.assertTrue(all(day[1] <= day[2] for day in data))
+            self.assertIn("500 Day Overview", weather.generate_summary(data))
+
+    def test_compare_flags_regressions(self):
+        baseline = {"results": [{"name": "load", "rows": 10, "seconds": 1.0},
+                                {"name": "summary", "rows": 10, "seconds": 1.0}]}
+        results = {"results": [{"name": "load", "rows": 10, "seconds": 1.1},
+                               {"name": "summary", "rows": 10, "seconds": 1.5},
+                               {"name": "new", "rows": 10, "seconds": 9.0}]}
+        self.assertEqual(bench_weather.compare(results, baseline, 0.2), [("summary", 10, 1.0, 1.5)])
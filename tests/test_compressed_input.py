@@ -0,0 +1,121 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import unittest
+import weather
+from weather.cli import main
+
+COMPRESSORS = {"gzip": (".gz", gzip.compress), "bz2": (".bz2", bz2.compress), "lzma": (".xz", lzma.compress)}
+
+
+class CompressedInputTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_compressed(self, example, kind, suffix=None):
+        """Writes a compressed copy of an example file, named example_<example>.csv<suffix>."""
+        extension, compress = COMPRESSORS[kind]
+        with open(f"tests/data/example_{example}.csv", "rb") as csv_file:
+            content = csv_file.read()
+        path = os.path.join(self.tmp.name, f"example_{example}.csv" + (extension if suffix is None else suffix))
+        with open(path, "wb") as compressed_file:
+            compressed_file.write(compress(content))
+        return path
+
+    def expected(self, name):
+        with open(f"tests/expected_output/{name}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_csv_compression(self):
+        self.assertIsNone(weather.csv_compression("tests/data/example_one.csv"))
+        for kind in COMPRESSORS:
+            self.assertEqual(weather.csv_compression(self.write_compressed("one", kind)), kind)
+
+    def test_detected_by_content_not_name(self):
+        path = self.write_compressed("two", "bz2", suffix="")
+        self.assertEqual(weather.load_data_from_csv(path), weather.load_data_from_csv("tests/data/example_two.csv"))
+
+    def test_load_and_summarize(self):
+        for kind in COMPRESSORS:
+            for example in ("one", "two", "three"):
+                with self.subTest(kind=kind, example=example):
+                    path = self.write_compressed(example, kind)
+                    rows = weather.load_data_from_csv(f"tests/data/example_{example}.csv")
+                    self.assertEqual(weather.load_data_from_csv(path), rows)
+                    self.assertEqual(list(weather.iter_data_from_csv(path, batch_size=2)),
+                                     [rows[i:i + 2] for i in range(0, len(rows), 2)])
+                    self.assertEqual(weather.load_table_from_csv(path).to_list(), rows)
+                    self.assertEqual(weather.generate_summary_from_csv(path, workers=4),
+                                     self.expected(f"example_{example}_summary"))
+
+    def test_large_file_streams(self):
+        with open("tests/data/example_one.csv", encoding="utf8") as csv_file:
+            header, *lines = csv_file.read().splitlines(keepends=True)
+        path = os.path.join(self.tmp.name, "large.csv.gz")
+        with gzip.open(path, "wt", encoding="utf8", newline="") as compressed_file:
+            compressed_file.write(header)
+            for _ in range(20000):
+                compressed_file.writelines(lines)
+        with gzip.open(path, "rb") as compressed_file:
+            size = len(compressed_file.read())
+        self.assertGreater(size, 2 * weather.COMPRESSED_READ_BYTES)
+        weather.enable_instrumentation()
+        self.addCleanup(weather.disable_instrumentation)
+        self.assertEqual(sum(len(batch) for batch in weather.iter_data_from_csv(path, batch_size=1000)),
+                         20000 * len(lines))
+        decompress = weather.instrumentation_stats()["decompress"]
+        self.assertEqual(decompress["bytes"], size)
+        # Each read fills at most one buffer, so the payload cannot arrive in one piece.
+        self.assertGreater(decompress["calls"], size // weather.COMPRESSED_READ_BYTES)
+
+    def test_stations(self):
+        path = os.path.join(self.tmp.name, "stations.csv.xz")
+        with lzma.open(path, "wt", encoding="utf8", newline="") as csv_file:
+            csv_file.write("station,date,min,max\n")
+            for example in ("one", "two"):
+                for date, low, high in weather.load_data_from_csv(f"tests/data/example_{example}.csv"):
+                    csv_file.write(f"{example},{date},{low},{high}\n")
+        summaries = weather.summarize_stations(path, workers=4)
+        self.assertEqual(list(summaries), ["one", "two"])
+        for example in ("one", "two"):
+            self.assertEqual(weather.format_summary(summaries[example]), self.expected(f"example_{example}_summary"))
+
+    def test_incremental_refuses_compressed_files(self):
+        path = self.write_compressed("one", "gzip")
+        with self.assertRaises(ValueError):
+            weather.update_incremental_summary(path)
+        self.assertFalse(os.path.exists(weather.incremental_state_path(path)))
+
+    def test_batch_finds_compressed_files(self):
+        for example, kind in (("one", "gzip"), ("two", "bz2"), ("three", "lzma")):
+            self.write_compressed(example, kind)
+        output_dir = os.path.join(self.tmp.name, "out")
+        out = io.StringIO()
+        err = io.StringIO()
+        self.assertEqual(main(["batch", self.tmp.name, "--output-dir", output_dir], out, err), 0)
+        self.assertEqual(sorted(os.listdir(output_dir)),
+                         ["example_one_summary.txt", "example_three_summary.txt", "example_two_summary.txt"])
+        with open(os.path.join(output_dir, "example_three_summary.txt"), encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), self.expected("example_three_summary"))
+
+    def test_instrumentation_counts_bytes(self):
+        path = self.write_compressed("one", "gzip")
+        weather.enable_instrumentation()
+        self.addCleanup(weather.disable_instrumentation)
+        weather.generate_summary(weather.iter_data_from_csv(path))
+        stats = weather.instrumentation_stats()
+        size = os.path.getsize("tests/data/example_one.csv")
+        self.assertEqual(stats["decompress"]["bytes"], size)
+        self.assertEqual(stats["parse"]["bytes"], size)
+        self.assertGreater(stats["decompress"]["calls"], 0)
+        self.assertIn('weather_stage_bytes_total{stage="decompress"} ' + str(size) + "\n",
+                      weather.instrumentation_prometheus())
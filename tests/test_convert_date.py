@@ -1,4 +1,5 @@
 import unittest
+from datetime import date, datetime
 import weather
 
 
@@ -46,3 +47,29 @@ class ConvertDateTests(unittest.TestCase):
         expected_result = "Sunday 31 October 2021"
         result = weather.convert_date(date)
         self.assertEqual(result, expected_result)
+
+    def test_convert_date_matches_strftime(self):
+        for offset in ["+08:00", "-05:30", "+00:00"]:
+            for ordinal in range(730000, 740000, 37):
+                day = date.fromordinal(ordinal)
+                iso_string = f"{day.isoformat()}T23:59:59{offset}"
+                expected_result = datetime.fromisoformat(iso_string).strftime("%A %d %B %Y")
+                self.assertEqual(weather.convert_date(iso_string), expected_result)
+
+    def test_convert_date_other_iso_formats(self):
+        self.assertEqual(weather.convert_date("2021-07-06"), "Tuesday 06 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-06T07:00:00"), "Tuesday 06 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-06T07:00:00.5+08:00"), "Tuesday 06 July 2021")
+
+    def test_convert_date_invalid(self):
+        for iso_string in ["2021-02-30T07:00:00+08:00", "2021-07-06T24:00:00+08:00", "not a date"]:
+            with self.assertRaises(ValueError):
+                weather.convert_date(iso_string)
+
+    def test_convert_date_checks_time_and_offset(self):
+        for iso_string in ["2021-07-06T07:60:00+08:00", "2021-07-06T07:00:60+08:00", "2021-07-06T07:00:00+24:00",
+                           "2021-07-06T07:00:00*08:00", "2021-07-06T0٧:00:00+08:00", "2021-W27-2T07:00:00+08:00x"]:
+            with self.assertRaises(ValueError):
+                weather.convert_date(iso_string)
+        self.assertEqual(weather.convert_date("2021-07-06T23:59:59-23:59"), "Tuesday 06 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-07T23:59:59-23:59"), "Wednesday 07 July 2021")
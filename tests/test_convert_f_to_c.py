@@ -31,3 +31,16 @@ class ConvertTempTests(unittest.TestCase):
         expected_result = 25.0
         result = weather.convert_f_to_c(temp_in_f)
         self.assertEqual(result, expected_result)
+
+    def test_convert_f_to_c_table_matches_arithmetic(self):
+        for temp_in_f in range(weather.TABLE_MIN_F - 5, weather.TABLE_MAX_F + 6):
+            expected_result = round((float(temp_in_f) - 32) * 5/9, 1)
+            self.assertEqual(weather.convert_f_to_c(temp_in_f), expected_result)
+            self.assertEqual(weather.convert_f_to_c(float(temp_in_f)), expected_result)
+            self.assertEqual(weather.core._format_f_as_c(temp_in_f), weather.format_temperature(expected_result))
+
+    def test_convert_f_to_c_many(self):
+        temps_in_f = [90, -40, 64.4, "77", 1000]
+        expected_result = [32.2, -40.0, 18.0, 25.0, 537.8]
+        result = weather.convert_f_to_c_many(temps_in_f)
+        self.assertEqual(result, expected_result)
@@ -0,0 +1,54 @@
+import unittest
+import weather
+
+
+class DateCacheTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def tearDown(self):
+        weather.disable_date_cache()
+
+    def test_cache_disabled_by_default(self):
+        self.assertIsNone(weather.date_cache_info())
+
+    def test_hits_misses_and_evictions(self):
+        weather.enable_date_cache(maxsize=2)
+        self.assertEqual(weather.convert_date("2021-07-05T07:00:00+08:00"), "Monday 05 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-05T07:00:00+08:00"), "Monday 05 July 2021")
+        weather.convert_date("2021-07-02T07:00:00+08:00")
+        weather.convert_date("2010-01-27T07:00:00+08:00")
+        expected_result = {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2}
+        self.assertEqual(weather.date_cache_info(), expected_result)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = weather.DateCache(maxsize=2)
+        cache.get("a", str.upper)
+        cache.get("b", str.upper)
+        cache.get("a", str.upper)
+        cache.get("c", str.upper)
+        self.assertEqual(cache.get("a", str.upper), "A")
+        self.assertEqual(cache.info()["hits"], 2)
+        cache.get("b", str.upper)
+        self.assertEqual(cache.info()["misses"], 4)
+
+    def test_evict_and_clear(self):
+        cache = weather.enable_date_cache()
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        self.assertTrue(cache.evict("2021-07-05T07:00:00+08:00"))
+        self.assertFalse(cache.evict("2021-07-05T07:00:00+08:00"))
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        cache.clear()
+        self.assertEqual(weather.date_cache_info(), {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 4096})
+
+    def test_daily_summary_with_cache(self):
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        weather.enable_date_cache()
+        data = weather.load_data_from_csv("tests/data/example_one.csv")
+        weather.generate_daily_summary(data)
+        result = weather.generate_daily_summary(data)
+        self.assertEqual(expected_result, result)
+        self.assertEqual(weather.date_cache_info()["hits"], 5)
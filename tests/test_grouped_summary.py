@@ -0,0 +1,51 @@
+import io
+import unittest
+import weather
+
+
+class GroupedSummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = weather.load_data_from_csv("tests/data/example_two.csv")
+
+    def test_weekly_summary(self):
+        expected_result = ("==== Week 25 of 2020 ====\n" + weather.generate_summary(self.example_two[:3]) + "\n"
+                           "==== Week 26 of 2020 ====\n" + weather.generate_summary(self.example_two[3:]) + "\n")
+        result = weather.generate_grouped_summary(weather.iter_data_from_csv("tests/data/example_two.csv"))
+        self.assertEqual(result, expected_result)
+
+    def test_chronological_order_for_unsorted_input(self):
+        data = [
+            ["2021-01-04T07:00:00+08:00", 40, 50],
+            ["2020-12-31T07:00:00+08:00", 41, 51],
+            ["2021-02-01T07:00:00+08:00", 42, 52],
+            ["2021-01-01T07:00:00+08:00", 43, 53],
+            ["2020-12-28T07:00:00+08:00", 44, 54],
+        ]
+        weeks = weather.summarize_by(data, "week")
+        self.assertEqual([key for key, _ in weeks], [(2020, 53), (2021, 1), (2021, 5)])
+        self.assertEqual([accumulator.count for _, accumulator in weeks], [3, 1, 1])
+        months = weather.summarize_by(iter(data), "month")
+        self.assertEqual([key for key, _ in months], [(2020, 12), (2021, 1), (2021, 2)])
+        self.assertEqual(months[1][1].min_timestamp, "2021-01-04T07:00:00+08:00")
+        years = weather.summarize_by(data, "year")
+        self.assertEqual([(key, accumulator.count) for key, accumulator in years], [((2020,), 2), ((2021,), 3)])
+
+        out = io.StringIO()
+        self.assertEqual(weather.write_grouped_summary(data, out, "month"), 3)
+        self.assertEqual([line for line in out.getvalue().splitlines() if line.startswith("====")],
+                         ["==== December 2020 ====", "==== January 2021 ====", "==== February 2021 ===="])
+        self.assertTrue(weather.generate_grouped_summary(data, "year").startswith("==== 2020 ====\n2 Day Overview\n"))
+
+    def test_each_group_matches_generate_summary(self):
+        data = weather.load_table_from_csv("tests/data/example_three.csv")
+        for block in weather.iter_grouped_summary(data, "month", percentiles=True):
+            self.assertEqual(block, "==== June 2020 ====\n"
+                             + weather.generate_summary(data.to_list(), percentiles=True) + "\n")
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            weather.summarize_by(self.example_two, "fortnight")
+        self.assertEqual(weather.generate_grouped_summary([], "month"), "")
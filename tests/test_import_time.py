@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The limit on the cumulative time of "import weather", in microseconds. It
+# measures about 16-18ms (mostly csv, re and datetime), so this leaves room for
+# a slow machine but not for a startup that has doubled.
+IMPORT_BUDGET_US = 30_000
+
+# Modules that only the optional features need, so "import weather" must not load them.
+DEFERRED_MODULES = ("numpy", "mmap", "asyncio", "concurrent.futures", "argparse", "hashlib", "json")
+
+
+def run_python(code, *options, env=None):
+    return subprocess.run([sys.executable, *options, "-c", code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+class ImportTimeTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def import_time(self):
+        """Returns the cumulative time of "import weather" in a new process, in microseconds."""
+        result = run_python("import weather", "-X", "importtime")
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == "weather":
+                return int(fields[1])
+        self.fail("import weather was not timed")
+
+    def test_import_is_within_budget(self):
+        # Make sure the bytecode is cached, then keep the best of a few runs to
+        # leave out compiling and any noise from other processes.
+        env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+        run_python("import weather", env=env)
+        self.assertLess(min(self.import_time() for _ in range(5)), IMPORT_BUDGET_US)
+
+    def test_optional_modules_are_not_imported(self):
+        code = ("import sys, weather\n"
+                f"print(sorted(name for name in {DEFERRED_MODULES!r} if name in sys.modules))")
+        result = run_python(code)
+        self.assertEqual(result.stdout, "[]\n")
+
+    def test_import_prints_nothing(self):
+        result = run_python("import weather")
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(result.stderr, "")
+
+    def test_lazy_names_load_their_submodule(self):
+        code = ("import sys, weather\n"
+                "weather.rolling_min([1, 2, 3], 2)\n"
+                "print('weather.rolling' in sys.modules, 'weather.service' in sys.modules)\n"
+                "print('rolling_min' in dir(weather), hasattr(weather, 'no_such_name'))")
+        result = run_python(code)
+        self.assertEqual(result.stdout, "True False\nTrue False\n")
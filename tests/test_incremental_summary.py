@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+import weather
+
+
+class IncrementalSummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "forecast.csv")
+        with open("tests/data/example_three.csv", encoding="utf8") as csv_file:
+            self.lines = csv_file.read().splitlines(keepends=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, text, mode="w"):
+        with open(self.path, mode, newline="") as csv_file:
+            csv_file.write(text)
+
+    def expected(self):
+        return weather.generate_summary(weather.load_data_from_csv(self.path))
+
+    def saved_offset(self):
+        with open(weather.incremental_state_path(self.path), encoding="utf8") as state:
+            return json.load(state)["offset"]
+
+    def test_appended_rows_are_added(self):
+        self.write("".join(self.lines[:4]))
+        self.assertEqual(weather.generate_incremental_summary(self.path), self.expected())
+        first_offset = self.saved_offset()
+        self.write("".join(self.lines[4:]), mode="a")
+        self.assertEqual(weather.generate_incremental_summary(self.path), self.expected())
+        self.assertEqual(self.saved_offset(), os.path.getsize(self.path))
+        self.assertGreater(self.saved_offset(), first_offset)
+
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), weather.generate_incremental_summary(self.path))
+
+    def test_unterminated_last_line(self):
+        self.write("".join(self.lines[:5]) + self.lines[5].rstrip("\n"))
+        self.assertEqual(weather.update_incremental_summary(self.path).count, 5)
+        self.assertEqual(self.saved_offset(), len("".join(self.lines[:5])))
+        self.write("\n" + "".join(self.lines[6:]), mode="a")
+        self.assertEqual(weather.generate_incremental_summary(self.path), self.expected())
+
+    def test_rewrite_triggers_rebuild(self):
+        self.write("".join(self.lines))
+        weather.generate_incremental_summary(self.path)
+        self.write(self.lines[0] + "".join(line.replace(",-", ",") for line in self.lines[1:]) + self.lines[1])
+        self.assertEqual(weather.generate_incremental_summary(self.path), self.expected())
+
+    def test_middle_edit_needs_full_check(self):
+        rows = "".join(f"2021-07-{day % 28 + 1:02d}T07:00:00+08:00,{50 + day % 7},{70 + day % 9}\n" for day in range(5000))
+        self.write(self.lines[0] + rows)
+        old_summary = weather.generate_incremental_summary(self.path)
+        middle = len(self.lines[0]) + rows.index("\n", len(rows) // 2) + 1 + len("2021-07-01T07:00:00+08:00,")
+
+        def correct(value):
+            with open(self.path, "r+b") as csv_file:
+                csv_file.seek(middle)
+                csv_file.write(value)
+
+        # Same length and the same first and last PREFIX_CHECK_BYTES, so only a full check notices.
+        correct(b"-9")
+        self.assertEqual(weather.generate_incremental_summary(self.path), old_summary)
+        self.assertEqual(weather.generate_incremental_summary(self.path, full_check=True), self.expected())
+        correct(b"-8")
+        self.assertEqual(weather.generate_incremental_summary(self.path, full_check=True), self.expected())
+        self.assertNotEqual(self.expected(), old_summary)
+
+    def test_truncation_triggers_rebuild(self):
+        self.write("".join(self.lines))
+        weather.generate_incremental_summary(self.path)
+        self.write("".join(self.lines[:3]))
+        self.assertEqual(weather.update_incremental_summary(self.path).count, 2)
+
+    def test_corrupt_state_triggers_rebuild(self):
+        self.write("".join(self.lines))
+        weather.generate_incremental_summary(self.path)
+        with open(weather.incremental_state_path(self.path), "w") as state:
+            state.write("{not json")
+        self.assertEqual(weather.generate_incremental_summary(self.path), self.expected())
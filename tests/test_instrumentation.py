@@ -0,0 +1,62 @@
+import unittest
+import weather
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def tearDown(self):
+        weather.disable_instrumentation()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(hasattr(weather.convert_date, "__wrapped__"))
+        self.assertFalse(hasattr(weather.SummaryAccumulator.update_batch, "__wrapped__"))
+
+    def test_records_each_stage(self):
+        weather.enable_instrumentation()
+        summary = weather.generate_summary(weather.iter_data_from_csv("tests/data/example_one.csv"))
+        daily = weather.generate_daily_summary(weather.load_data_from_csv("tests/data/example_one.csv"))
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), summary)
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), daily)
+
+        stats = weather.instrumentation_stats()
+        self.assertEqual(set(stats), {"parse", "convert_date", "convert_f_to_c", "aggregate", "render"})
+        self.assertEqual(stats["parse"]["calls"], 2)
+        self.assertEqual(stats["convert_date"]["calls"], 2 + 5)
+        self.assertEqual(stats["convert_f_to_c"]["calls"], 4 + 10)
+        self.assertEqual(stats["render"]["calls"], 2)
+        for stage in stats.values():
+            self.assertGreaterEqual(stage["wall_seconds"], 0.0)
+            self.assertGreaterEqual(stage["cpu_seconds"], 0.0)
+
+    def test_disable_restores_functions(self):
+        original = weather.convert_date
+        weather.enable_instrumentation()
+        self.assertIsNot(weather.convert_date, original)
+        weather.disable_instrumentation()
+        self.assertIs(weather.convert_date, original)
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        self.assertEqual(weather.instrumentation_stats(), {})
+
+    def test_patches_every_weather_module(self):
+        from weather import parallel
+        original = weather.core._read_rows
+        weather.enable_instrumentation()
+        self.assertIs(parallel._read_rows, weather.core._read_rows)
+        self.assertIs(weather.format_summary, weather.core.format_summary)
+        self.assertTrue(hasattr(parallel._read_rows, "__wrapped__"))
+        weather.disable_instrumentation()
+        self.assertIs(parallel._read_rows, original)
+
+    def test_prometheus_format(self):
+        weather.enable_instrumentation()
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        text = weather.instrumentation_prometheus()
+        self.assertIn("# TYPE weather_stage_calls_total counter\n", text)
+        self.assertIn('weather_stage_calls_total{stage="convert_date"} 1\n', text)
+        self.assertIn('weather_stage_cpu_seconds_total{stage="convert_date"} ', text)
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+import weather
+
+
+class LoadTableTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_csv(self, content):
+        path = os.path.join(self.tmp.name, "data.csv")
+        with open(path, "wb") as csv_file:
+            csv_file.write(content)
+        return path
+
+    def test_matches_load_data_from_csv(self):
+        for example in ["one", "two", "three"]:
+            path = f"tests/data/example_{example}.csv"
+            table = weather.load_table_from_csv(path)
+            self.assertListEqual(table.to_list(), weather.load_data_from_csv(path))
+
+    def test_uses_memory_map(self):
+        table = weather.load_table_from_csv("tests/data/example_one.csv")
+        self.assertNotIsInstance(table._text, bytearray)
+        self.assertEqual(table.timestamp(4), "2021-07-06T07:00:00+08:00")
+
+    def test_irregular_files(self):
+        contents = [
+            b"date,min,max\r\n2021-07-02T07:00:00+08:00,49,67\r\n\r\n2021-07-03T07:00:00+08:00, -57,68\r\n",
+            b"date,min,max\n\n\n2021-07-02T07:00:00+08:00,49,67\n2021-07-03T07:00:00+08:00,-57,68",
+            b'date,min,max\n"2021-07-02T07:00:00+08:00",49,67\n2021-07-03T07:00:00+08:00,-57,"68"\n',
+            b"date,min,max\n2021-07-02T07:00:00+08:00,49,67,extra\n2021-07-03T07:00:00+08:00,-57,68\n",
+            b"date,min,max\n2021-07-02T07:00:00+08:00,+49,67\n2021-07-03T07:00:00+08:00,-57,68\n",
+        ]
+        expected_result = [["2021-07-02T07:00:00+08:00", 49, 67], ["2021-07-03T07:00:00+08:00", -57, 68]]
+        for content in contents:
+            path = self.write_csv(content)
+            self.assertListEqual(weather.load_table_from_csv(path).to_list(), expected_result)
+            self.assertListEqual(weather.load_data_from_csv(path), expected_result)
+
+    def test_carriage_return_line_endings(self):
+        contents = [
+            b"date,min,max\r2021-07-02T07:00:00+08:00,49,67\r2021-07-03T07:00:00+08:00,-57,68\r",
+            b"date,min,max\r2021-07-02T07:00:00+08:00,49,67\n2021-07-03T07:00:00+08:00,-57,68\n",
+        ]
+        expected_result = [["2021-07-02T07:00:00+08:00", 49, 67], ["2021-07-03T07:00:00+08:00", -57, 68]]
+        for content in contents:
+            path = self.write_csv(content)
+            self.assertListEqual(weather.load_table_from_csv(path).to_list(), expected_result)
+            self.assertListEqual(weather.load_data_from_csv(path), expected_result)
+
+    def test_header_only_and_empty(self):
+        self.assertEqual(len(weather.load_table_from_csv(self.write_csv(b"date,min,max"))), 0)
+        self.assertEqual(len(weather.load_table_from_csv(self.write_csv(b""))), 0)
+
+    def test_append_to_mapped_table(self):
+        table = weather.load_table_from_csv("tests/data/example_one.csv")
+        table.append("2021-07-07T07:00:00+08:00", 50, 60)
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table[0][0], "2021-07-02T07:00:00+08:00")
+        self.assertEqual(table[5], ["2021-07-07T07:00:00+08:00", 50, 60])
+
+    def test_small_chunks(self):
+        chunk_bytes = weather.fastcsv.MAPPED_CHUNK_BYTES
+        weather.fastcsv.MAPPED_CHUNK_BYTES = 30
+        try:
+            table = weather.load_table_from_csv("tests/data/example_three.csv")
+        finally:
+            weather.fastcsv.MAPPED_CHUNK_BYTES = chunk_bytes
+        self.assertListEqual(table.to_list(), weather.load_data_from_csv("tests/data/example_three.csv"))
@@ -0,0 +1,62 @@
+import random
+import unittest
+from array import array
+import weather
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyBackendTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.threshold = weather.core.NUMPY_THRESHOLD
+        weather.core.NUMPY_THRESHOLD = 1
+
+    def tearDown(self):
+        weather.core.NUMPY_THRESHOLD = self.threshold
+
+    def test_find_min_and_max(self):
+        temperatures = array("q", [49, 57, 56, 55, 53, 49, 57])
+        self.assertEqual(weather.find_min(temperatures), (49.0, 5))
+        self.assertEqual(weather.find_max(temperatures), (57.0, 6))
+        self.assertEqual(weather.find_min(numpy.array(["49", "57", "56", "55", "53", "49"])), (49.0, 5))
+        self.assertEqual(weather.find_min(numpy.array([-10, -8, 2, -16, 4])), (-16.0, 3))
+        self.assertEqual(weather.find_min(memoryview(array("q", [3, 1, 2]))), (1.0, 1))
+        self.assertEqual(weather.find_min(array("q")), ())
+
+    def test_calculate_mean(self):
+        self.assertEqual(weather.calculate_mean(array("q", [49, 57, 56, 55, 53])), 54.0)
+        self.assertEqual(weather.calculate_mean(numpy.array(["51", "58", "59", "52", "52", "48", "56", "57"])), 54.125)
+        self.assertEqual(weather.calculate_mean(array("q", [-10, -8, 2, -16, 4])), -5.6)
+
+    def test_lists_use_python_loop(self):
+        self.assertIsNone(weather.core._numpy_backend([49, 57, 56]))
+        self.assertIsNone(weather.core._numpy_backend(["49", "57", "56"]))
+        self.assertIsNotNone(weather.core._numpy_backend(array("q", [49, 57, 56])))
+        weather.core.NUMPY_THRESHOLD = 4
+        self.assertIsNone(weather.core._numpy_backend(array("q", [49, 57, 56])))
+        self.assertIsNotNone(weather.core._numpy_backend(numpy.array([49, 57, 56])))
+
+    def test_matches_python_loop(self):
+        rng = random.Random(7)
+        temperatures = [rng.randint(-60, 120) for _ in range(5000)]
+        floats = [rng.uniform(-60, 120) for _ in range(5000)]
+        expected = [weather.find_min(temperatures), weather.find_max(temperatures),
+                    weather.calculate_mean(temperatures), weather.calculate_mean(floats)]
+        chunk = weather.core.NUMPY_CHUNK
+        weather.core.NUMPY_CHUNK = 999
+        try:
+            result = [weather.find_min(array("q", temperatures)), weather.find_max(array("q", temperatures)),
+                      weather.calculate_mean(array("q", temperatures)), weather.calculate_mean(array("d", floats))]
+        finally:
+            weather.core.NUMPY_CHUNK = chunk
+        self.assertEqual(result, expected)
+        self.assertEqual(weather.calculate_mean(numpy.array(floats)), expected[3])
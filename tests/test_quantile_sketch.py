@@ -0,0 +1,111 @@
+import bisect
+import json
+import random
+import statistics
+import unittest
+import weather
+
+
+def exact_quantile(sorted_values, q):
+    position = q * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class QuantileSketchTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = weather.load_data_from_csv("tests/data/example_two.csv")
+
+    def test_exact_for_small_inputs(self):
+        rng = random.Random(3)
+        values = [rng.randint(-40, 110) for _ in range(999)]
+        sketch = weather.QuantileSketch()
+        for value in values:
+            sketch.add(value)
+        self.assertTrue(sketch.exact)
+        self.assertEqual(sketch.quantile(0.5), statistics.median(values))
+        expected = statistics.quantiles(values, n=20, method="inclusive")
+        self.assertAlmostEqual(sketch.quantile(0.05), expected[0])
+        self.assertAlmostEqual(sketch.quantile(0.95), expected[-1])
+        self.assertEqual(sketch.quantile(0), min(values))
+        self.assertEqual(sketch.quantile(1), max(values))
+        self.assertIsNone(weather.QuantileSketch().quantile(0.5))
+        with self.assertRaises(ValueError):
+            sketch.quantile(1.5)
+
+    def test_bounded_and_accurate_for_large_inputs(self):
+        rng = random.Random(4)
+        values = [rng.gauss(50, 15) for _ in range(50000)]
+        sketch = weather.QuantileSketch(compression=100)
+        for value in values:
+            sketch.add(value)
+        self.assertFalse(sketch.exact)
+        self.assertLessEqual(len(sketch.to_dict()["centroids"]), 100)
+        ordered = sorted(values)
+        for q in (0.01, 0.05, 0.5, 0.95, 0.99):
+            rank = bisect.bisect(ordered, sketch.quantile(q)) / len(ordered)
+            self.assertAlmostEqual(rank, q, delta=0.005)
+        self.assertEqual(sketch.quantile(0), ordered[0])
+        self.assertEqual(sketch.quantile(1), ordered[-1])
+
+    def test_merge(self):
+        rng = random.Random(5)
+        values = [rng.uniform(-20, 120) for _ in range(20000)]
+        whole = weather.QuantileSketch()
+        whole.add_many(values)
+        parts = [weather.QuantileSketch(), weather.QuantileSketch(exact_limit=10**6), weather.QuantileSketch()]
+        for i, part in enumerate(parts):
+            part.add_many(values[i::3])
+        merged = parts[0].merge(parts[1]).merge(parts[2])
+        self.assertEqual(len(merged), len(values))
+        ordered = sorted(values)
+        for q in (0.05, 0.5, 0.95):
+            self.assertAlmostEqual(merged.quantile(q), exact_quantile(ordered, q), delta=1.0)
+            self.assertAlmostEqual(merged.quantile(q), whole.quantile(q), delta=1.0)
+
+        small = weather.QuantileSketch().merge(weather.QuantileSketch())
+        small.add_many([3, 1, 2])
+        other = weather.QuantileSketch()
+        other.add_many([5, 4])
+        self.assertTrue(small.merge(other).exact)
+        self.assertEqual(small.quantile(0.5), 3)
+
+    def test_round_trip(self):
+        sketch = weather.QuantileSketch(exact_limit=16)
+        sketch.add_many(range(100))
+        restored = weather.QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        self.assertEqual(restored.quantile(0.3), sketch.quantile(0.3))
+        self.assertEqual(restored.to_dict(), sketch.to_dict())
+
+    def test_summary_percentiles(self):
+        lows = sorted(day[1] for day in self.example_two)
+        highs = sorted(day[2] for day in self.example_two)
+        accumulator = weather.SummaryAccumulator(percentiles=True).update_batch(self.example_two)
+        self.assertEqual(accumulator.low_percentiles(), tuple(exact_quantile(lows, q) for q in weather.SUMMARY_PERCENTILES))
+        self.assertEqual(accumulator.high_percentiles((0.5,)), (statistics.median(highs),))
+        with self.assertRaises(ValueError):
+            weather.SummaryAccumulator().update_batch(self.example_two).low_percentiles()
+
+        table = weather.SummaryAccumulator(percentiles=True).update_batch(weather.load_table_from_csv("tests/data/example_two.csv"))
+        self.assertEqual(table.low_percentiles(), accumulator.low_percentiles())
+        first = weather.SummaryAccumulator(percentiles=True).update_batch(self.example_two[:3])
+        first.merge(weather.SummaryAccumulator(percentiles=True).update_batch(self.example_two[3:]))
+        self.assertEqual(first.high_percentiles(), accumulator.high_percentiles())
+        with self.assertRaises(ValueError):
+            first.merge(weather.SummaryAccumulator().update_batch(self.example_two))
+        restored = weather.SummaryAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+        self.assertEqual(restored.low_percentiles(), accumulator.low_percentiles())
+
+    def test_generate_summary_with_percentiles(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        self.assertEqual(weather.generate_summary(self.example_two), expected_result)
+        result = weather.generate_summary(self.example_two, percentiles=True)
+        self.assertEqual(result, expected_result
+                         + "  The median low this week is 11.1°C (5th percentile 8.5°C, 95th percentile 14.8°C).\n"
+                         + "  The median high this week is 19.4°C (5th percentile 11.7°C, 95th percentile 22.0°C).\n")
+        self.assertEqual(weather.generate_summary_from_csv("tests/data/example_two.csv", workers=1, percentiles=True), result)
@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+import unittest
+import weather
+
+
+class RenderTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_text_matches_generate_functions(self):
+        for example in ["one", "two", "three"]:
+            with open(f"tests/expected_output/example_{example}_summary.txt", encoding="utf8") as txt_file:
+                expected_summary = txt_file.read()
+            with open(f"tests/expected_output/example_{example}_daily_summary.txt", encoding="utf8") as txt_file:
+                expected_daily = txt_file.read()
+            out = io.StringIO()
+            weather.render_summary(weather.iter_data_from_csv(f"tests/data/example_{example}.csv"), out)
+            self.assertEqual(expected_summary, out.getvalue())
+            out = io.StringIO()
+            days = weather.render_daily_summary(weather.load_table_from_csv(f"tests/data/example_{example}.csv"), out)
+            self.assertEqual(expected_daily, out.getvalue())
+            self.assertEqual(days, expected_daily.count("----") // 2)
+
+    def test_source_field(self):
+        data = weather.load_data_from_csv("tests/data/example_one.csv")
+        out = io.StringIO()
+        weather.render_summary(data, out, "jsonl", source="one.csv")
+        record = json.loads(out.getvalue())
+        self.assertEqual(list(record)[:2], ["file", "days"])
+        self.assertEqual(record["file"], "one.csv")
+        out = io.StringIO()
+        weather.render_daily_summary(data, out, "jsonl", source="one.csv")
+        self.assertEqual(json.loads(out.getvalue().splitlines()[0]),
+                         {"file": "one.csv", "date": "2021-07-02T07:00:00+08:00", "min_c": 9.4, "max_c": 19.4})
+        out = io.StringIO()
+        weather.render_summary(data, out, "csv", source="one.csv")
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0][:2], ["file", "days"])
+        self.assertEqual(rows[1][:2], ["one.csv", "5"])
+
+    def test_jsonl_summary(self):
+        out = io.StringIO()
+        weather.render_summary(weather.load_data_from_csv("tests/data/example_one.csv"), out, "jsonl")
+        self.assertEqual(out.getvalue().count("\n"), 1)
+        self.assertEqual(json.loads(out.getvalue()), {
+            "days": 5,
+            "lowest_c": 9.4,
+            "lowest_date": "2021-07-02T07:00:00+08:00",
+            "highest_c": 20.0,
+            "highest_date": "2021-07-03T07:00:00+08:00",
+            "mean_low_c": 12.2,
+            "mean_high_c": 17.8,
+        })
+
+    def test_jsonl_daily(self):
+        data = weather.load_data_from_csv("tests/data/example_two.csv")
+        out = io.StringIO()
+        days = weather.render_daily_summary(iter(data), out, "jsonl")
+        lines = out.getvalue().splitlines()
+        self.assertEqual(days, len(data))
+        self.assertEqual(len(lines), len(data))
+        for line, (date, low, high) in zip(lines, data):
+            self.assertEqual(json.loads(line), {"date": date, "min_c": weather.convert_f_to_c(low),
+                                                "max_c": weather.convert_f_to_c(high)})
+            self.assertEqual(json.dumps(json.loads(line)), line)
+
+    def test_csv_output(self):
+        data = weather.load_data_from_csv("tests/data/example_three.csv")
+        out = io.StringIO()
+        weather.render_daily_summary(data, out, "csv")
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0], ["date", "min_c", "max_c"])
+        self.assertEqual(rows[1:], [[date, str(weather.convert_f_to_c(low)), str(weather.convert_f_to_c(high))]
+                                    for date, low, high in data])
+
+        out = io.StringIO()
+        weather.render_summary(weather.SummaryAccumulator().update_batch(data), out, "csv")
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0], list(weather.render.SUMMARY_FIELDS))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][0], str(len(data)))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            weather.render_summary([], io.StringIO(), "csv")
+        with self.assertRaises(ValueError):
+            weather.get_renderer("xml")
+
+    def test_custom_renderer(self):
+        class CountRenderer:
+            def write_summary(self, accumulator, out):
+                out.write(f"{accumulator.count}\n")
+
+        weather.RENDERERS["count"] = CountRenderer
+        try:
+            out = io.StringIO()
+            weather.render_summary(weather.load_data_from_csv("tests/data/example_one.csv"), out, "count")
+            self.assertEqual(out.getvalue(), "5\n")
+        finally:
+            del weather.RENDERERS["count"]
@@ -0,0 +1,42 @@
+import random
+import unittest
+import weather
+
+
+class RollingStatsTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_three = [
+            ["2020-06-19T07:00:00+08:00", -47, -46],
+            ["2020-06-20T07:00:00+08:00", -51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", -52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", -48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def test_matches_find_functions(self):
+        rng = random.Random(3)
+        temperatures = [rng.randint(-5, 5) for _ in range(300)]
+        for window in [1, 2, 7, 30]:
+            windows = [temperatures[i:i + window] for i in range(len(temperatures) - window + 1)]
+            expected_min = [(value, i + position) for i, (value, position) in enumerate(map(weather.find_min, windows))]
+            expected_max = [(value, i + position) for i, (value, position) in enumerate(map(weather.find_max, windows))]
+            self.assertEqual(list(weather.rolling_min(temperatures, window)), expected_min)
+            self.assertEqual(list(weather.rolling_max(temperatures, window)), expected_max)
+            self.assertEqual(list(weather.rolling_mean(temperatures, window)), list(map(weather.calculate_mean, windows)))
+
+    def test_short_input(self):
+        self.assertEqual(list(weather.rolling_min([1, 2], 3)), [])
+        with self.assertRaises(ValueError):
+            list(weather.rolling_mean([1, 2], 0))
+
+    def test_iter_rolling_summary(self):
+        result = list(weather.iter_rolling_summary(iter(self.example_three), 3))
+        self.assertEqual(len(result), 6)
+        self.assertEqual(result[0], ("2020-06-21T07:00:00+08:00", (-51.0, 1), (72.0, 2), -40 / 3, 31.0))
+        self.assertEqual(result[2], ("2020-06-23T07:00:00+08:00", (-52.0, 4), (72.0, 2), 65 / 3, 214 / 3))
@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class SidecarTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "example_three.csv")
+        shutil.copy("tests/data/example_three.csv", self.path)
+        self.expected_result = weather.load_data_from_csv(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_sidecar_round_trip(self):
+        first = weather.load_table_from_csv(self.path, sidecar=True)
+        self.assertTrue(os.path.exists(weather.sidecar_path(self.path)))
+        second = weather.load_table_from_csv(self.path, sidecar=True)
+        self.assertIsInstance(second.mins, memoryview)
+        self.assertListEqual(first.to_list(), self.expected_result)
+        self.assertListEqual(second.to_list(), self.expected_result)
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), weather.generate_summary(second))
+
+    def test_sidecar_invalidated_when_csv_changes(self):
+        weather.load_table_from_csv(self.path, sidecar=True)
+        with open(self.path, "a") as csv_file:
+            csv_file.write("2020-06-27T07:00:00+08:00,60,80\n")
+        table = weather.load_table_from_csv(self.path, sidecar=True)
+        self.assertEqual(len(table), 9)
+        self.assertEqual(table[8], ["2020-06-27T07:00:00+08:00", 60, 80])
+        self.assertEqual(len(weather.load_table_from_csv(self.path, sidecar=True)), 9)
+
+    def test_sidecar_survives_touch(self):
+        weather.load_table_from_csv(self.path, sidecar=True)
+        os.utime(self.path, ns=(1, 1))
+        table = weather.load_table_from_csv(self.path, sidecar=True)
+        self.assertIsInstance(table.mins, memoryview)
+        self.assertListEqual(table.to_list(), self.expected_result)
+
+    def test_touch_updates_sidecar_mtime(self):
+        weather.load_table_from_csv(self.path, sidecar=True)
+        os.utime(self.path, ns=(1, 1))
+        weather.load_table_from_csv(self.path, sidecar=True)
+        hashes = []
+        file_sha256 = weather.sidecar._file_sha256
+        weather.sidecar._file_sha256 = lambda path: hashes.append(path) or file_sha256(path)
+        try:
+            table = weather.load_table_from_csv(self.path, sidecar=True)
+        finally:
+            weather.sidecar._file_sha256 = file_sha256
+        self.assertEqual(hashes, [])
+        self.assertIsInstance(table.mins, memoryview)
+        self.assertListEqual(table.to_list(), self.expected_result)
+
+    def test_same_size_edit_with_restored_mtime(self):
+        weather.load_table_from_csv(self.path, sidecar=True)
+        stat = os.stat(self.path)
+        with open(self.path, "r+b") as csv_file:
+            csv_file.seek(-3, os.SEEK_END)
+            csv_file.write(b"99\n")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.path.getsize(self.path), stat.st_size)
+        table = weather.load_table_from_csv(self.path, sidecar=True)
+        self.assertListEqual(table.to_list(), weather.load_data_from_csv(self.path))
+        self.assertEqual(table[-1][2], 99)
+
+    def test_settled_csv_is_not_hashed(self):
+        os.utime(self.path, ns=(1, 1))
+        weather.load_table_from_csv(self.path, sidecar=True)
+        hashes = []
+        file_sha256 = weather.sidecar._file_sha256
+        weather.sidecar._file_sha256 = lambda path: hashes.append(path) or file_sha256(path)
+        try:
+            table = weather.load_table_from_csv(self.path, sidecar=True)
+        finally:
+            weather.sidecar._file_sha256 = file_sha256
+        self.assertEqual(hashes, [])
+        self.assertIsInstance(table.mins, memoryview)
+
+    def test_corrupt_sidecar_is_rebuilt(self):
+        weather.load_table_from_csv(self.path, sidecar=True)
+        with open(weather.sidecar_path(self.path), "r+b") as sidecar:
+            sidecar.truncate(40)
+        table = weather.load_table_from_csv(self.path, sidecar=True)
+        self.assertListEqual(table.to_list(), self.expected_result)
+        self.assertIsInstance(weather.load_table_from_csv(self.path, sidecar=True).mins, memoryview)
+
+    def test_append_to_sidecar_table(self):
+        weather.load_table_from_csv(self.path, sidecar=True)
+        table = weather.load_table_from_csv(self.path, sidecar=True)
+        table.append("2020-06-27T07:00:00+08:00", 60, 80)
+        self.assertListEqual(table.to_list(), self.expected_result + [["2020-06-27T07:00:00+08:00", 60, 80]])
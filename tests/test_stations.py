@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+import weather
+
+EXAMPLES = {"north": "one", "south": "two", "east": "three"}
+
+
+class StationTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.data = {station: weather.load_data_from_csv(f"tests/data/example_{example}.csv")
+                     for station, example in EXAMPLES.items()}
+
+    def write_interleaved(self, tmp, header="station,date,min,max", station_column="station"):
+        """Writes the three examples as one file, taking a row from each station in turn."""
+        path = os.path.join(tmp, "stations.csv")
+        with open(path, "w", newline="") as csv_file:
+            csv_file.write(header + "\n")
+            for i in range(8):
+                for station, rows in self.data.items():
+                    if i < len(rows):
+                        values = {station_column: station, "date": rows[i][0], "min": rows[i][1], "max": rows[i][2]}
+                        csv_file.write(",".join(str(values[name]) for name in header.split(",")) + "\n")
+                csv_file.write("\n")
+        return path
+
+    def expected(self, name):
+        with open(f"tests/expected_output/{name}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_load_and_summarize(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.write_interleaved(tmp)
+            tables = weather.load_stations_from_csv(path)
+            self.assertEqual(list(tables), ["north", "south", "east"])
+            for station, rows in self.data.items():
+                self.assertEqual(tables[station].to_list(), rows)
+            summaries = weather.summarize_stations(path)
+            self.assertEqual(list(summaries), ["east", "north", "south"])
+            for station, example in EXAMPLES.items():
+                self.assertEqual(weather.format_summary(summaries[station]), self.expected(f"example_{example}_summary"))
+
+    def test_generate_station_summary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.write_interleaved(tmp, header="date,min,max,site", station_column="site")
+            expected_result = "".join(f"==== Station {station} ====\n" + self.expected(f"example_{EXAMPLES[station]}_summary") + "\n"
+                                      for station in sorted(EXAMPLES))
+            self.assertEqual(weather.generate_station_summary(path, station_column="site"), expected_result)
+            sharded = weather.stations.summarize_stations(path, "site", workers=3, min_shard_bytes=1)
+            self.assertEqual({station: accumulator.to_dict() for station, accumulator in sharded.items()},
+                             {station: accumulator.to_dict()
+                              for station, accumulator in weather.summarize_stations(path, "site").items()})
+            expected_daily = "".join(f"==== Station {station} ====\n" + self.expected(f"example_{EXAMPLES[station]}_daily_summary")
+                                     for station in sorted(EXAMPLES))
+            self.assertEqual(weather.generate_station_summary(path, "site", daily=True), expected_daily)
+
+    def test_write_station_summaries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.write_interleaved(tmp, header="id,date,min,max", station_column="id")
+            for daily in [False, True]:
+                suffix = "_daily_summary" if daily else "_summary"
+                paths = weather.write_station_summaries(path, os.path.join(tmp, "out"), "id", daily=daily, days_per_write=2)
+                self.assertEqual(list(paths), ["east", "north", "south"])
+                for station, example in EXAMPLES.items():
+                    self.assertEqual(paths[station], os.path.join(tmp, "out", f"{station}{suffix}.txt"))
+                    with open(paths[station], encoding="utf8") as txt_file:
+                        self.assertEqual(txt_file.read(), self.expected(f"example_{example}{suffix}"))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            list(weather.iter_station_rows("tests/data/example_one.csv"))
+        self.assertEqual(weather.stations.station_file_name("../a b"), "_a_b_summary.txt")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "clash.csv")
+            with open(path, "w") as csv_file:
+                csv_file.write("station,date,min,max\na b,2021-07-02T07:00:00+08:00,49,67\na_b,2021-07-02T07:00:00+08:00,49,67\n")
+            with self.assertRaises(ValueError):
+                weather.write_station_summaries(path, tmp)
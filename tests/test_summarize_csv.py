@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+import weather
+
+
+class SummarizeCSVTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_shard_boundaries_align_to_lines(self):
+        with open("tests/data/example_two.csv", "rb") as csv_file:
+            data = csv_file.read()
+        boundaries = weather.parallel._shard_boundaries("tests/data/example_two.csv", 3)
+        self.assertEqual(boundaries[0], data.index(b"\n") + 1)
+        self.assertEqual(boundaries[-1], len(data))
+        for offset in boundaries[1:-1]:
+            self.assertEqual(data[offset - 1:offset], b"\n")
+
+    def test_generate_summary_from_csv(self):
+        for example in ["one", "two", "three"]:
+            with open(f"tests/expected_output/example_{example}_summary.txt", encoding="utf8") as txt_file:
+                expected_result = txt_file.read()
+            result = weather.generate_summary_from_csv(f"tests/data/example_{example}.csv", workers=1)
+            self.assertEqual(expected_result, result)
+
+    def test_sharded_summary_keeps_last_tie(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ties.csv")
+            with open(path, "w", newline="") as csv_file:
+                csv_file.write("date,min,max\n")
+                for day in range(1, 29):
+                    csv_file.write(f"2021-02-{day:02d}T07:00:00+08:00,40,60\n\n")
+            sharded = weather.summarize_csv(path, workers=4, min_shard_bytes=1)
+            expected = weather.SummaryAccumulator().update_batch(weather.load_data_from_csv(path))
+            self.assertEqual(sharded.count, 28)
+            self.assertEqual(sharded.min_position, 27)
+            self.assertEqual(sharded.max_timestamp, "2021-02-28T07:00:00+08:00")
+            self.assertEqual(weather.format_summary(sharded), weather.format_summary(expected))
@@ -0,0 +1,56 @@
+import unittest
+import weather
+
+
+class SummaryAccumulatorTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = [
+            ["2020-06-19T07:00:00+08:00", 47, 46],
+            ["2020-06-20T07:00:00+08:00", 51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", 52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", 48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def test_update_matches_find_functions(self):
+        accumulator = weather.SummaryAccumulator()
+        for day in self.example_two:
+            accumulator.update(day)
+        self.assertEqual(accumulator.count, 8)
+        self.assertEqual((accumulator.min_value, accumulator.min_position), (47.0, 0))
+        self.assertEqual((accumulator.max_value, accumulator.max_position), (72.0, 2))
+        self.assertEqual(accumulator.mean_low, weather.calculate_mean([day[1] for day in self.example_two]))
+        self.assertEqual(accumulator.mean_high, weather.calculate_mean([day[2] for day in self.example_two]))
+
+    def test_ties_use_last_position(self):
+        accumulator = weather.SummaryAccumulator().update_batch([
+            ["2020-06-19T07:00:00+08:00", 50, 70],
+            ["2020-06-20T07:00:00+08:00", 50, 70],
+        ])
+        self.assertEqual(accumulator.min_position, 1)
+        self.assertEqual(accumulator.max_timestamp, "2020-06-20T07:00:00+08:00")
+
+    def test_merge_matches_single_pass(self):
+        whole = weather.SummaryAccumulator().update_batch(self.example_two)
+        for split in range(len(self.example_two) + 1):
+            merged = weather.SummaryAccumulator().update_batch(self.example_two[:split])
+            merged.merge(weather.SummaryAccumulator().update_batch(self.example_two[split:]))
+            self.assertEqual(weather.format_summary(merged), weather.format_summary(whole))
+            self.assertEqual(merged.max_position, whole.max_position)
+
+    def test_update_batch_with_table(self):
+        table = weather.WeatherTable.from_rows(self.example_two)
+        accumulator = weather.SummaryAccumulator().update_batch(self.example_two[:3])
+        accumulator.update_batch(table)
+        self.assertEqual(accumulator.count, 11)
+        self.assertEqual(accumulator.max_position, 5)
+
+    def test_empty_summary(self):
+        with self.assertRaises(ValueError):
+            weather.generate_summary([])
@@ -0,0 +1,165 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import weather
+
+
+async def request(port, method, target, body=b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), payload
+
+
+class SummaryServiceTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def run_service(self, scenario, **kwargs):
+        async def run():
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                service = weather.SummaryService(executor, **kwargs)
+                server = await service.start("127.0.0.1", 0)
+                async with server:
+                    return await scenario(service, server.sockets[0].getsockname()[1])
+        return asyncio.run(run())
+
+    def test_summary_and_cache(self):
+        with open("tests/data/example_one.csv", "rb") as csv_file:
+            body = csv_file.read()
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_summary = txt_file.read()
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_daily = txt_file.read()
+
+        async def scenario(service, port):
+            first = await request(port, "POST", "/summary", body)
+            second = await request(port, "POST", "/summary", body)
+            daily = await request(port, "POST", "/daily-summary", body)
+            metrics = await request(port, "GET", "/metrics")
+            return first, second, daily, json.loads(metrics[1])
+
+        first, second, daily, metrics = self.run_service(scenario)
+        self.assertEqual(first, (200, expected_summary.encode("utf8")))
+        self.assertEqual(second, first)
+        self.assertEqual(daily, (200, expected_daily.encode("utf8")))
+        self.assertEqual(metrics["cache"]["hits"], 1)
+        self.assertEqual(metrics["cache"]["misses"], 2)
+        self.assertAlmostEqual(metrics["cache"]["hit_rate"], 1 / 3)
+        self.assertEqual(metrics["requests"], 3)
+        self.assertIn("p99", metrics["latency_ms"])
+
+    def test_summary_by_path(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_summary = txt_file.read()
+
+        async def scenario(service, port):
+            found = await request(port, "POST", "/summary?path=example_two.csv")
+            outside = await request(port, "POST", "/summary?path=../expected_output/example_two_summary.txt")
+            missing = await request(port, "POST", "/summary?path=nothing.csv")
+            return found, outside[0], missing[0]
+
+        found, outside, missing = self.run_service(scenario, data_dir="tests/data")
+        self.assertEqual(found, (200, expected_summary.encode("utf8")))
+        self.assertEqual(outside, 403)
+        self.assertEqual(missing, 404)
+
+    def test_formats(self):
+        with open("tests/data/example_one.csv", "rb") as csv_file:
+            body = csv_file.read()
+
+        async def scenario(service, port):
+            text = await request(port, "POST", "/summary", body)
+            jsonl = await request(port, "POST", "/summary?format=jsonl", body)
+            daily_csv = await request(port, "POST", "/daily-summary?format=csv", body)
+            unknown = await request(port, "POST", "/summary?format=xml", body)
+            return text, jsonl, daily_csv, unknown[0]
+
+        text, jsonl, daily_csv, unknown = self.run_service(scenario)
+        self.assertTrue(text[1].startswith(b"5 Day Overview"))
+        self.assertEqual(json.loads(jsonl[1])["days"], 5)
+        self.assertEqual(daily_csv[1].splitlines()[:2], [b"date,min_c,max_c", b"2021-07-02T07:00:00+08:00,9.4,19.4"])
+        self.assertEqual(unknown, 400)
+
+    def test_compressed_body(self):
+        with open("tests/data/example_one.csv", "rb") as csv_file:
+            body = gzip.compress(csv_file.read())
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_summary = txt_file.read()
+
+        async def scenario(service, port):
+            summary = await request(port, "POST", "/summary", body)
+            truncated = await request(port, "POST", "/summary", body[:-12])
+            return summary, truncated[0]
+
+        summary, truncated = self.run_service(scenario)
+        self.assertEqual(summary, (200, expected_summary.encode("utf8")))
+        self.assertEqual(truncated, 400)
+
+    def test_file_larger_than_body_limit(self):
+        async def scenario(service, port):
+            too_large = await request(port, "POST", "/summary?path=example_one.csv")
+            body = await request(port, "POST", "/summary", b"date,min,max\n" + b"\n" * size)
+            return too_large[0], body[0]
+
+        size = os.path.getsize("tests/data/example_one.csv")
+        self.assertEqual(self.run_service(scenario, data_dir="tests/data", max_body_bytes=size - 1), (413, 413))
+        self.assertEqual(weather.service._cache_key("summary", "text", b"abc"),
+                         hashlib.sha256(b"summary\0text\0abc").digest())
+
+    def test_errors(self):
+        async def scenario(service, port):
+            bad_csv = await request(port, "POST", "/summary", b"date,min,max\n2021-07-02T07:00:00+08:00,cold,67\n")
+            unknown = await request(port, "GET", "/nowhere")
+            wrong_method = await request(port, "GET", "/summary")
+            no_paths = await request(port, "POST", "/summary?path=example_one.csv")
+            return bad_csv[0], unknown[0], wrong_method[0], no_paths[0], service.errors
+
+        self.assertEqual(self.run_service(scenario), (400, 404, 405, 403, 4))
+
+    def test_csv_module_errors(self):
+        body = b'date,min,max\n"' + b"x" * 200000 + b'",49,67\n'
+
+        async def scenario(service, port):
+            return (await request(port, "POST", "/summary", body))[0], service.errors
+
+        self.assertEqual(self.run_service(scenario), (400, 1))
+
+    def test_unexpected_errors(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+
+        async def run():
+            service = weather.SummaryService(executor)
+            server = await service.start("127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                failed = await request(port, "POST", "/summary", b"date,min,max\n2021-07-02T07:00:00+08:00,49,67\n")
+                metrics = await request(port, "GET", "/metrics")
+                return failed, json.loads(metrics[1])
+
+        failed, metrics = asyncio.run(run())
+        self.assertEqual(failed[0], 500)
+        self.assertIn(b"RuntimeError", failed[1])
+        self.assertEqual(metrics["requests"], 1)
+        self.assertEqual(metrics["errors"], 1)
+
+    def test_cache_evicts_by_size(self):
+        cache = weather.ResponseCache(max_bytes=10)
+        cache.put(b"a", b"12345")
+        cache.put(b"b", b"12345")
+        cache.get(b"a")
+        cache.put(b"c", b"12345")
+        self.assertIsNone(cache.get(b"b"))
+        self.assertEqual(cache.get(b"a"), b"12345")
+        self.assertEqual(cache.info()["evictions"], 1)
+        self.assertEqual(cache.info()["bytes"], 10)
@@ -0,0 +1,68 @@
+import random
+import unittest
+import weather
+from tests.helpers import make_days
+
+
+class SummaryTreeTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_updates_match_recomputing(self):
+        for count in [1, 2, 5, 64, 100]:
+            data = make_days(count, seed=count, lows=(30, 40))
+            tree = weather.SummaryTree(data)
+            rng = random.Random(count + 1)
+            for _ in range(200):
+                position = rng.randrange(count)
+                data[position][1:] = [rng.randint(30, 40), rng.randint(50, 60)]
+                day = position if rng.random() < 0.5 else data[position][0]
+                tree.update(day, data[position][1], data[position][2])
+                first = rng.randrange(count)
+                last = rng.randrange(first, count)
+                start, end = data[first][0][:10], data[last][0][:10]
+                self.assertEqual(tree.summarize_range(start, end), weather.generate_summary(data[first:last + 1]))
+                self.assertEqual(tree.range_min(start, end)[1] - first,
+                                 weather.find_min([day[1] for day in data[first:last + 1]])[1])
+                self.assertEqual(tree.range_max(start, end)[1] - first,
+                                 weather.find_max([day[2] for day in data[first:last + 1]])[1])
+            self.assertEqual(tree.to_list(), data)
+
+    def test_example(self):
+        data = weather.load_data_from_csv("tests/data/example_one.csv")
+        tree = weather.SummaryTree(weather.load_table_from_csv("tests/data/example_one.csv"))
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(tree.summarize_range(), txt_file.read())
+        tree.update("2021-07-04", 40, 80)
+        self.assertEqual(tree[2], ["2021-07-04T07:00:00+08:00", 40, 80])
+        self.assertEqual(tree.range_min(), (40.0, 2))
+        self.assertEqual(tree.range_max("2021-07-03", "2021-07-05"), (80.0, 2))
+        self.assertEqual(tree.range_mean(), (weather.calculate_mean([49, 57, 40, 55, 53]),
+                                             weather.calculate_mean([67, 68, 80, 61, 62])))
+        data[2][1:] = [40, 80]
+        self.assertEqual(tree.summarize_range("2021-07-03"), weather.generate_summary(data[1:]))
+
+    def test_ties_go_to_the_last_day(self):
+        tree = weather.SummaryTree([[f"2021-07-0{day}T07:00:00+08:00", 50, 60] for day in range(1, 8)])
+        self.assertEqual(tree.range_min(), (50.0, 6))
+        tree.update(6, 51, 59)
+        self.assertEqual(tree.range_min(), (50.0, 5))
+        self.assertEqual(tree.range_max(), (60.0, 5))
+        tree.update(2, 50, 60)
+        self.assertEqual(tree.range_max(end="2021-07-04"), (60.0, 3))
+
+    def test_errors(self):
+        data = make_days(3, seed=1, lows=(30, 40))
+        tree = weather.SummaryTree(data + [["2021-01-03T19:00:00+08:00", 40, 50]])
+        with self.assertRaises(IndexError):
+            tree.update(4, 40, 50)
+        with self.assertRaises(KeyError):
+            tree.update("2021-01-03", 40, 50)
+        with self.assertRaises(KeyError):
+            tree.update("2022-01-01", 40, 50)
+        self.assertEqual(tree.range_min("2022-01-01", "2022-02-01"), ())
+        self.assertEqual(tree.range_mean("2022-01-01", "2022-02-01"), ())
+        with self.assertRaises(ValueError):
+            weather.SummaryTree(list(reversed(data)))
@@ -0,0 +1,77 @@
+import random
+import unittest
+from datetime import date, datetime
+import weather
+from tests.helpers import make_days
+
+
+class WeatherIndexTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_summarize_range_matches_generate_summary(self):
+        data = make_days(400, seed=1)
+        index = weather.WeatherIndex(data)
+        rng = random.Random(2)
+        for _ in range(300):
+            first = rng.randrange(len(data))
+            last = rng.randrange(first, len(data))
+            start = data[first][0][:10]
+            end = date.fromisoformat(data[last][0][:10])
+            self.assertEqual(index.summarize_range(start, end), weather.generate_summary(data[first:last + 1]))
+            self.assertEqual(index.positions(start, end), (first, last + 1))
+
+    def test_whole_file(self):
+        for example in ["one", "two", "three"]:
+            with open(f"tests/expected_output/example_{example}_summary.txt", encoding="utf8") as txt_file:
+                expected_result = txt_file.read()
+            index = weather.WeatherIndex(weather.load_table_from_csv(f"tests/data/example_{example}.csv"))
+            self.assertEqual(index.summarize_range(), expected_result)
+
+    def test_example_range(self):
+        index = weather.WeatherIndex(weather.load_data_from_csv("tests/data/example_two.csv"))
+        self.assertEqual(index.summarize_range("2020-06-21", datetime(2020, 6, 24, 23, 0)),
+                         weather.generate_summary(weather.load_data_from_csv("tests/data/example_two.csv")[2:6]))
+        self.assertEqual(index.range_min("2020-06-23", "2020-06-24"), (52.0, 5))
+        self.assertEqual(index.range_max("2020-06-20", "2020-06-23"), (72.0, 2))
+        self.assertEqual(index.range_min("2021-01-01", "2021-02-01"), ())
+        self.assertEqual(index.range_max("2020-06-24", "2020-06-20"), ())
+        with self.assertRaises(ValueError):
+            index.summarize_range("2019-01-01", "2019-12-31")
+
+    def test_ties_go_to_the_last_day(self):
+        data = [[f"2021-07-0{day}T07:00:00+08:00", 50, 60] for day in range(1, 8)]
+        index = weather.WeatherIndex(data)
+        self.assertEqual(index.range_min("2021-07-02", "2021-07-06"), (50.0, 5))
+        self.assertEqual(index.range_max(end="2021-07-04"), (60.0, 3))
+        accumulator = index.range_accumulator("2021-07-02", "2021-07-06")
+        self.assertEqual((accumulator.min_position, accumulator.max_position), (4, 4))
+
+    def test_decimal_temperatures(self):
+        data = [[day, low + 0.1, high + 0.7] for day, low, high in make_days(100, seed=3)]
+        index = weather.WeatherIndex(data)
+        for first, last in [(0, 99), (10, 10), (17, 63)]:
+            self.assertEqual(index.range_accumulator(data[first][0], data[last][0]).to_dict(),
+                             weather.SummaryAccumulator().update_batch(data[first:last + 1]).to_dict())
+
+    def test_rejects_unsorted_data(self):
+        data = make_days(5, seed=4)
+        data[1], data[3] = data[3], data[1]
+        with self.assertRaises(ValueError):
+            weather.WeatherIndex(data)
+
+    def test_numpy_sparse_tables(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+        data = make_days(300, seed=5)
+        threshold = weather.core.NUMPY_THRESHOLD
+        weather.core.NUMPY_THRESHOLD = 1
+        try:
+            index = weather.WeatherIndex(data)
+        finally:
+            weather.core.NUMPY_THRESHOLD = threshold
+        self.assertEqual(index.summarize_range(data[20][0], data[250][0]), weather.generate_summary(data[20:251]))
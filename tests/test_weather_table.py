@@ -0,0 +1,55 @@
+import unittest
+import weather
+
+
+class WeatherTableTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_three = [
+            ["2020-06-19T07:00:00+08:00", -47, -46],
+            ["2020-06-20T07:00:00+08:00", -51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", -52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", -48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def test_load_table_from_csv(self):
+        result = weather.load_table_from_csv("tests/data/example_three.csv")
+        self.assertEqual(len(result), 8)
+        self.assertListEqual(result.to_list(), self.example_three)
+
+    def test_row_view(self):
+        table = weather.WeatherTable.from_rows(self.example_three)
+        day = table[4]
+        self.assertEqual(day[0], "2020-06-23T07:00:00+08:00")
+        self.assertEqual(day[1], -52)
+        self.assertEqual(day[2], 71)
+        self.assertEqual(day[-1], 71)
+        self.assertEqual(table[-1], self.example_three[-1])
+        with self.assertRaises(IndexError):
+            day[3]
+        with self.assertRaises(IndexError):
+            table[8]
+
+    def test_columns(self):
+        table = weather.WeatherTable.from_rows(self.example_three)
+        self.assertEqual(weather.find_min(table.mins), (-52.0, 4))
+        self.assertEqual(weather.find_max(table.maxs), (72.0, 2))
+        self.assertEqual(weather.calculate_mean(table.mins), 3.0)
+
+    def test_generate_summary_from_table(self):
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        table = weather.load_table_from_csv("tests/data/example_three.csv")
+        self.assertEqual(expected_result, weather.generate_summary(table))
+
+    def test_generate_daily_summary_from_table(self):
+        with open("tests/expected_output/example_three_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        table = weather.load_table_from_csv("tests/data/example_three.csv")
+        self.assertEqual(expected_result, weather.generate_daily_summary(table))
@@ -0,0 +1,27 @@
+import io
+import unittest
+import weather
+
+
+class WriteDailySummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_write_daily_summary(self):
+        for example in ["one", "two", "three"]:
+            with open(f"tests/expected_output/example_{example}_daily_summary.txt", encoding="utf8") as txt_file:
+                expected_result = txt_file.read()
+            out = io.StringIO()
+            data = weather.iter_data_from_csv(f"tests/data/example_{example}.csv")
+            days = weather.write_daily_summary(data, out, days_per_write=3)
+            self.assertEqual(expected_result, out.getvalue())
+            self.assertEqual(days, expected_result.count("----") // 2)
+
+    def test_iter_daily_summary(self):
+        data = weather.load_data_from_csv("tests/data/example_one.csv")
+        blocks = list(weather.iter_daily_summary(data))
+        self.assertEqual(len(blocks), 5)
+        expected_result = "---- Friday 02 July 2021 ----\n  Minimum Temperature: 9.4°C\n  Maximum Temperature: 19.4°C\n\n"
+        self.assertEqual(blocks[0], expected_result)
@@ -0,0 +1,105 @@
+"""Loading, converting and summarising daily weather data.
+
+The core functions are imported straight away. Everything else (the date
+cache, rolling statistics, parallel and incremental summaries, sidecars,
+instrumentation, the HTTP service and the command line) lives in a
+submodule that is only imported the first time one of its names is used.
+"""
+import importlib
+
+from weather.core import (
+    DEGREE_SYMBOL,
+    TABLE_MAX_F,
+    SUMMARY_PERCENTILES,
+    TABLE_MIN_F,
+    SummaryAccumulator,
+    WeatherRow,
+    WeatherTable,
+    calculate_mean,
+    convert_date,
+    convert_f_to_c,
+    convert_f_to_c_many,
+    csv_compression,
+    find_max,
+    find_min,
+    format_summary,
+    format_temperature,
+    generate_daily_summary,
+    generate_summary,
+    iter_daily_summary,
+    iter_data_from_csv,
+    load_data_from_csv,
+    load_table_from_csv,
+    open_csv,
+    write_daily_summary,
+)
+
+# Names that are imported from a submodule on first use.
+_LAZY = {
+    "NUMPY_THRESHOLD": "core",
+    "COMPRESSED_READ_BYTES": "core",
+    "DateCache": "datecache",
+    "enable_date_cache": "datecache",
+    "disable_date_cache": "datecache",
+    "date_cache_info": "datecache",
+    "rolling_min": "rolling",
+    "rolling_max": "rolling",
+    "rolling_mean": "rolling",
+    "iter_rolling_summary": "rolling",
+    "SHARD_MIN_BYTES": "parallel",
+    "summarize_csv": "parallel",
+    "generate_summary_from_csv": "parallel",
+    "MAPPED_CHUNK_BYTES": "fastcsv",
+    "SIDECAR_SUFFIX": "sidecar",
+    "sidecar_path": "sidecar",
+    "INCREMENTAL_SUFFIX": "incremental",
+    "PREFIX_CHECK_BYTES": "incremental",
+    "incremental_state_path": "incremental",
+    "update_incremental_summary": "incremental",
+    "generate_incremental_summary": "incremental",
+    "INSTRUMENTED_STAGES": "instrument",
+    "enable_instrumentation": "instrument",
+    "disable_instrumentation": "instrument",
+    "instrumentation_stats": "instrument",
+    "instrumentation_prometheus": "instrument",
+    "ResponseCache": "service",
+    "SummaryService": "service",
+    "serve": "service",
+    "RENDERERS": "render",
+    "TextRenderer": "render",
+    "JsonLinesRenderer": "render",
+    "CsvRenderer": "render",
+    "get_renderer": "render",
+    "render_summary": "render",
+    "render_daily_summary": "render",
+    "QuantileSketch": "sketch",
+    "iter_station_rows": "stations",
+    "load_stations_from_csv": "stations",
+    "summarize_stations": "stations",
+    "generate_station_summary": "stations",
+    "write_station_summaries": "stations",
+    "summarize_by": "groups",
+    "iter_grouped_summary": "groups",
+    "write_grouped_summary": "groups",
+    "generate_grouped_summary": "groups",
+    "WeatherIndex": "index",
+    "SummaryTree": "segtree",
+    "main": "cli",
+}
+
+_SUBMODULES = ("cli", "core", "datecache", "fastcsv", "groups", "incremental", "index", "instrument",
+               "parallel", "render", "rolling", "segtree", "service", "sidecar", "sketch", "stations")
+
+
+def __getattr__(name):
+    # The value is looked up every time rather than cached here, so that
+    # settings such as weather.fastcsv.MAPPED_CHUNK_BYTES are always current.
+    if name in _LAZY:
+        return getattr(importlib.import_module("weather." + _LAZY[name]), name)
+    if name in _SUBMODULES:
+        return importlib.import_module("weather." + name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
@@ -0,0 +1,188 @@
+"""The python -m weather command line."""
+import argparse
+import csv
+import glob
+import io
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from weather.core import _percentile, load_table_from_csv
+from weather.render import RENDERERS, render_daily_summary, render_summary
+
+
+def _summarize_files(paths, daily=False, format_name="text", percentiles=False, with_source=False):
+    """Summarises a batch of csv files, recording rows and time taken per file.
+
+    With with_source=True, jsonl records and csv rows start with the csv file's path.
+
+    Returns:
+        A list of (path, summary text or None, rows, seconds, error message or None).
+    """
+    results = []
+    for path in paths:
+        started = time.perf_counter()
+        try:
+            table = load_table_from_csv(path)
+            rendered = io.StringIO()
+            source = path if with_source else None
+            if daily:
+                render_daily_summary(table, rendered, format_name, source)
+            else:
+                render_summary(table, rendered, format_name, percentiles, source)
+            text = rendered.getvalue()
+        except (OSError, ValueError, IndexError, csv.Error) as error:
+            results.append((path, None, 0, time.perf_counter() - started, str(error)))
+        else:
+            results.append((path, text, len(table), time.perf_counter() - started, None))
+    return results
+
+
+# The csv file names picked up from directories given to batch.
+CSV_PATTERNS = ("*.csv", "*.csv.gz", "*.csv.bz2", "*.csv.xz")
+
+
+def _output_stem(path):
+    """Returns a csv file's name without its directory, compression suffix or .csv extension."""
+    name = os.path.basename(path)
+    for extension in (".gz", ".bz2", ".xz"):
+        if name.endswith(".csv" + extension):
+            name = name[:-len(extension)]
+            break
+    return os.path.splitext(name)[0]
+
+
+def _find_csv_files(targets):
+    """Expands directories and glob patterns into a sorted list of csv files."""
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            for pattern in CSV_PATTERNS:
+                paths.extend(glob.glob(os.path.join(glob.escape(target), pattern)))
+        else:
+            paths.extend(glob.glob(target, recursive=True))
+    return sorted(set(paths))
+
+
+def _run_batch(args, out, err):
+    """Runs the batch command, returning the process exit code."""
+    paths = _find_csv_files(args.targets)
+    if not paths:
+        print("no csv files found", file=err)
+        return 1
+    suffix = ("_daily_summary" if args.daily else "_summary") + RENDERERS[args.format].suffix
+    # Name every output file up front, so two inputs with the same name (e.g.
+    # a/x.csv and b/x.csv, or x.csv and x.csv.gz) fail before any work is done
+    # instead of overwriting each other.
+    names = {}
+    if args.output_dir:
+        owners = {}
+        for path in paths:
+            name = _output_stem(path) + suffix
+            if name in owners:
+                print(f"{owners[name]} and {path} would both be written to {name}", file=err)
+                return 1
+            owners[name] = path
+            names[path] = name
+        os.makedirs(args.output_dir, exist_ok=True)
+    chunks = [paths[i:i + args.chunk_size] for i in range(0, len(paths), args.chunk_size)]
+    latencies = []
+    totals = {"rows": 0, "failed": 0}
+    # Machine-readable output on stdout is one stream of records, each naming
+    # its file, so it stays valid JSON Lines or csv (with a single header row).
+    combined = not args.output_dir and args.format != "text"
+    header = {"written": False}
+
+    def emit(results):
+        for path, text, rows, seconds, error in results:
+            latencies.append(seconds)
+            if error is not None:
+                totals["failed"] += 1
+                print(f"{path}: {error}", file=err)
+                continue
+            totals["rows"] += rows
+            if args.output_dir:
+                with open(os.path.join(args.output_dir, names[path]), "w", encoding="utf8") as summary_file:
+                    summary_file.write(text)
+            elif combined:
+                if args.format == "csv" and header["written"]:
+                    text = text.partition("\n")[2]
+                header["written"] = True
+                out.write(text)
+            else:
+                out.write(f"==> {path} <==\n{text}\n")
+
+    started = time.perf_counter()
+    if args.workers == 1:
+        for chunk in chunks:
+            emit(_summarize_files(chunk, args.daily, args.format, args.percentiles, combined))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_summarize_files, chunk, args.daily, args.format,
+                                               args.percentiles, combined))
+                if len(pending) >= 2 * args.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        emit(future.result())
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    emit(future.result())
+    elapsed = max(time.perf_counter() - started, 1e-9)
+
+    latencies.sort()
+    print(f"{len(paths)} files, {totals['rows']} rows in {elapsed:.3f}s "
+          f"({len(paths) / elapsed:.1f} files/s, {totals['rows'] / elapsed:.0f} rows/s); "
+          f"latency p50 {_percentile(latencies, 0.50) * 1000:.2f}ms, "
+          f"p99 {_percentile(latencies, 0.99) * 1000:.2f}ms; "
+          f"{totals['failed']} failed", file=err)
+    return 1 if totals["failed"] else 0
+
+
+def main(argv=None, out=None, err=None):
+    """Command line entry point, e.g. python -m weather batch stations/ --workers 8.
+
+    Args:
+        argv: The command line arguments, defaulting to sys.argv[1:].
+        out: Where summaries are written, defaulting to sys.stdout.
+        err: Where errors and the throughput report go, defaulting to sys.stderr.
+    Returns:
+        The process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m weather")
+    commands = parser.add_subparsers(dest="command", required=True)
+    batch = commands.add_parser("batch", help="summarise many csv files concurrently")
+    batch.add_argument("targets", nargs="+", help="directories of csv files or glob patterns")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                       help="number of worker processes (default: number of CPUs)")
+    batch.add_argument("--chunk-size", type=int, default=16,
+                       help="files handed to a worker per task (default: 16)")
+    batch.add_argument("--output-dir", help="write one summary file per csv file here instead of to stdout "
+                                            "(jsonl and csv output on stdout gets a file field instead)")
+    batch.add_argument("--daily", action="store_true", help="write daily summaries instead of overviews")
+    batch.add_argument("--format", choices=sorted(RENDERERS), default="text",
+                       help="output format (default: text)")
+    batch.add_argument("--percentiles", action="store_true",
+                       help="add median, 5th and 95th percentile lows and highs to overviews")
+    service = commands.add_parser("serve", help="run the HTTP summary service")
+    service.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    service.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    service.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                         help="number of worker processes (default: number of CPUs)")
+    service.add_argument("--cache-mb", type=int, default=64, help="size of the response cache (default: 64)")
+    service.add_argument("--data-dir", help="allow summarising files under this directory by path")
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        import asyncio
+        from weather.service import serve
+        try:
+            asyncio.run(serve(args.host, args.port, args.workers, args.cache_mb * 1024 * 1024, args.data_dir))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be at least 1")
+    return _run_batch(args, out or sys.stdout, err or sys.stderr)
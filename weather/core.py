@@ -0,0 +1,982 @@
+"""The core weather functions: loading, converting and summarising data."""
+import csv
+import importlib
+import io
+import math
+import os
+from array import array
+from datetime import date, datetime
+
+DEGREE_SYMBOL = u"\N{DEGREE SIGN}C"
+
+# The DateCache used by convert_date, set by weather.datecache.enable_date_cache.
+_date_cache = None
+
+# Called with (stage, byte count) as csv text is read, while weather.instrument
+# is recording stage timings.
+_byte_counter = None
+
+
+def format_temperature(temp):
+    """Takes a temperature and returns it in string format with the degrees
+        and Celcius symbols.
+
+    Args:
+        temp: A string representing a temperature.
+    Returns:
+        A string contain the temperature and "degrees Celcius."
+    """
+    return f"{temp}{DEGREE_SYMBOL}"
+
+
+# Lookup tables for building "Weekday DD Month YYYY" without strftime.
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_DAY_TEXT = tuple(f" {day:02d} " for day in range(32))
+_MONTH_TEXT = (None, "January ", "February ", "March ", "April ", "May ", "June ", "July ",
+               "August ", "September ", "October ", "November ", "December ")
+
+
+# The time and offset parts ("THH:MM:SS+HH:MM") already seen in 25-character
+# timestamps. Data files repeat the same few, so checking one is a set lookup.
+_TIME_SUFFIXES = set()
+_TIME_SUFFIXES_MAX = 4096
+
+
+def _is_time_suffix(suffix):
+    """Returns whether suffix is exactly "THH:MM:SS+HH:MM" (or "-HH:MM") with every field in range."""
+    if not (len(suffix) == 15 and suffix[0] == "T" and suffix[3] == ":" and suffix[6] == ":"
+            and suffix[9] in ("+", "-") and suffix[12] == ":"):
+        return False
+    fields = (suffix[1:3], suffix[4:6], suffix[7:9], suffix[10:12], suffix[13:15])
+    if not all(field.isascii() and field.isdigit() for field in fields):
+        return False
+    hours, minutes, seconds, offset_hours, offset_minutes = map(int, fields)
+    return hours < 24 and minutes < 60 and seconds < 60 and offset_hours < 24 and offset_minutes < 60
+
+
+def _parse_iso_date(iso_string):
+    """Returns the calendar date of an ISO timestamp.
+
+    Timestamps shaped exactly like YYYY-MM-DDTHH:MM:SS+HH:MM (as in the data
+    files) only have their date part parsed, once their time and offset have
+    been checked; anything else goes through datetime.fromisoformat.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        A datetime.date.
+    """
+    if len(iso_string) == 25 and iso_string[4] == "-" and iso_string[7] == "-":
+        suffix = iso_string[10:]
+        if suffix in _TIME_SUFFIXES:
+            return date.fromisoformat(iso_string[:10])
+        if _is_time_suffix(suffix):
+            if len(_TIME_SUFFIXES) >= _TIME_SUFFIXES_MAX:
+                _TIME_SUFFIXES.clear()
+            _TIME_SUFFIXES.add(suffix)
+            return date.fromisoformat(iso_string[:10])
+    return datetime.fromisoformat(iso_string).date()
+
+
+def _format_date(day):
+    """Formats a date like strftime("%A %d %B %Y") without going through strftime."""
+    if day.year < 1000:
+        return day.strftime("%A %d %B %Y")
+    return _WEEKDAY_NAMES[day.weekday()] + _DAY_TEXT[day.day] + _MONTH_TEXT[day.month] + str(day.year)
+
+
+def _convert_date(iso_string):
+    """Formats an ISO date string without consulting the cache."""
+    return _format_date(_parse_iso_date(iso_string))
+
+
+def convert_date(iso_string):
+    """Converts and ISO formatted date into a human-readable format.
+
+    Results are memoised when the cache has been turned on with weather.enable_date_cache.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        A date formatted like: Weekday Date Month Year e.g. Tuesday 06 July 2021
+    """
+    cache = _date_cache
+    if cache is not None:
+        return cache.get(iso_string, _convert_date)
+    return _convert_date(iso_string)
+
+
+def _f_to_c(temp_in_fahrenheit):
+    """Converts Fahrenheit to Celcius with plain arithmetic, rounded to 1 decimal place."""
+    temp = float(temp_in_fahrenheit)
+    celcius = (temp - 32) * 5/9
+    rounded_number = round(celcius, 1)
+    return(rounded_number)
+
+
+# Precomputed conversions for the whole-degree readings the loader produces.
+# Each entry is computed with _f_to_c, so lookups match the arithmetic exactly.
+TABLE_MIN_F = -200
+TABLE_MAX_F = 200
+_CELCIUS_TABLE = tuple(_f_to_c(temp) for temp in range(TABLE_MIN_F, TABLE_MAX_F + 1))
+_CELCIUS_TEXT_TABLE = tuple(format_temperature(temp) for temp in _CELCIUS_TABLE)
+
+
+def convert_f_to_c(temp_in_fahrenheit):
+    """Converts a temperature from Fahrenheit to Celcius.
+
+    Whole degrees between TABLE_MIN_F and TABLE_MAX_F are looked up in a
+    precomputed table; everything else is calculated.
+
+    Args:
+        temp_in_fahrenheit: float representing a temperature.
+    Returns:
+        A float representing a temperature in degrees Celcius, rounded to 1 decimal place.
+    """
+    kind = type(temp_in_fahrenheit)
+    if kind is int:
+        if TABLE_MIN_F <= temp_in_fahrenheit <= TABLE_MAX_F:
+            return _CELCIUS_TABLE[temp_in_fahrenheit - TABLE_MIN_F]
+    elif kind is float and temp_in_fahrenheit.is_integer():
+        if TABLE_MIN_F <= temp_in_fahrenheit <= TABLE_MAX_F:
+            return _CELCIUS_TABLE[int(temp_in_fahrenheit) - TABLE_MIN_F]
+    return _f_to_c(temp_in_fahrenheit)
+
+
+def convert_f_to_c_many(temps_in_fahrenheit):
+    """Converts many temperatures from Fahrenheit to Celcius.
+
+    Args:
+        temps_in_fahrenheit: An iterable of temperatures, e.g. a WeatherTable column.
+    Returns:
+        A list of floats in degrees Celcius, each rounded to 1 decimal place.
+    """
+    table = _CELCIUS_TABLE
+    result = []
+    append = result.append
+    for temp in temps_in_fahrenheit:
+        if type(temp) is int and TABLE_MIN_F <= temp <= TABLE_MAX_F:
+            append(table[temp - TABLE_MIN_F])
+        else:
+            append(convert_f_to_c(temp))
+    return result
+
+
+def _format_f_as_c(temp_in_fahrenheit):
+    """Converts a Fahrenheit temperature and formats it like format_temperature."""
+    if type(temp_in_fahrenheit) is int and TABLE_MIN_F <= temp_in_fahrenheit <= TABLE_MAX_F:
+        return _CELCIUS_TEXT_TABLE[temp_in_fahrenheit - TABLE_MIN_F]
+    return format_temperature(convert_f_to_c(temp_in_fahrenheit))
+
+
+# Lists at least this long are handed to NumPy, when it is installed.
+NUMPY_THRESHOLD = 100_000
+
+# How many floats calculate_mean adds up with NumPy at a time.
+NUMPY_CHUNK = 65536
+
+_numpy = None
+
+
+def _get_numpy():
+    """Imports NumPy on first use, returning None if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def _numpy_backend(weather_data):
+    """Returns the NumPy module if it should be used for weather_data, otherwise None.
+
+    NumPy arrays always use NumPy, and large array.array or memoryview columns
+    (e.g. WeatherTable.mins) do too, since NumPy can read them without copying.
+    Lists stay on the plain loops: converting them costs as much as the loop.
+    """
+    if type(weather_data).__module__ == "numpy":
+        return _get_numpy()
+    if isinstance(weather_data, (array, memoryview)) and len(weather_data) >= NUMPY_THRESHOLD:
+        return _get_numpy()
+    return None
+
+
+def _as_numeric_array(np, weather_data):
+    """Converts a list, array column or NumPy array into a numeric NumPy array,
+        parsing strings (or other objects) as floats.
+    """
+    values = np.asarray(weather_data)
+    if values.dtype.kind not in "iuf":
+        values = values.astype(np.float64)
+    return values
+
+
+def calculate_mean(weather_data):
+    """Calculates the mean value from a list of numbers.
+
+    Large array columns and NumPy arrays are averaged with NumPy when it is available.
+
+    Args:
+        weather_data: a list (or array column, or NumPy array) of numbers.
+    Returns:
+        A float representing the mean value.
+    """
+    np = _numpy_backend(weather_data)
+    if np is not None and len(weather_data):
+        values = _as_numeric_array(np, weather_data)
+        if values.dtype.kind in "iu":
+            # Integer totals are exact, just like adding the floats one by one.
+            return float(values.sum(dtype=np.int64)) / len(values)
+        # cumsum adds in order, so the rounding matches the loop below. It runs
+        # a chunk at a time, carrying the total into each chunk's first value.
+        total = 0.0
+        for start in range(0, len(values), NUMPY_CHUNK):
+            chunk = values[start:start + NUMPY_CHUNK].astype(np.float64)
+            chunk[0] += total
+            total = float(np.cumsum(chunk, out=chunk)[-1])
+        return total / len(values)
+
+    total = 0.0
+    for temp in weather_data:
+        total += float(temp) 
+    result = total/ len(weather_data)
+    return result
+
+
+def _percentile(sorted_values, fraction):
+    """Returns the nearest-rank percentile of an already sorted list (used for latencies)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+# The first bytes of each compressed format, and the module that decompresses it.
+_COMPRESSION_MAGIC = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"))
+
+# How much to read from disk, and to decompress, at a time.
+COMPRESSED_READ_BYTES = 1024 * 1024
+
+
+def _detect_compression(head):
+    """Returns "gzip", "bz2" or "lzma" if head starts with their magic bytes, otherwise None."""
+    for magic, module in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return module
+    return None
+
+
+def csv_compression(csv_file):
+    """Returns how a csv file is compressed.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        "gzip", "bz2" or "lzma" (for xz), or None for a plain csv file.
+    """
+    with open(csv_file, 'rb') as data:
+        return _detect_compression(data.read(6))
+
+
+class _CountingReader(io.RawIOBase):
+    """Reads a binary stream, counting the csv bytes handed to the parser."""
+
+    def __init__(self, stream, source=None):
+        io.RawIOBase.__init__(self)
+        self._stream = stream
+        self._source = source
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._stream.readinto(buffer)
+        if _byte_counter is not None:
+            _byte_counter("parse", count)
+        return count
+
+    def close(self):
+        if not self.closed:
+            self._stream.close()
+            if self._source is not None:
+                self._source.close()
+        io.RawIOBase.close(self)
+
+
+class _DecompressingReader(_CountingReader):
+    """Reads a gzip, bz2 or xz stream, so decompression is timed (and counted)
+        separately from parsing. Corrupt or truncated data raises ValueError.
+    """
+
+    def __init__(self, stream, source, errors):
+        _CountingReader.__init__(self, stream, source)
+        self._errors = errors
+
+    def readinto(self, buffer):
+        try:
+            count = self._stream.readinto(buffer)
+        except self._errors as error:
+            raise ValueError(f"could not decompress csv data: {error}") from error
+        if _byte_counter is not None:
+            _byte_counter("decompress", count)
+            _byte_counter("parse", count)
+        return count
+
+
+def _open_binary(data):
+    """Wraps a binary file (or io.BytesIO) so it reads as plain csv bytes,
+        decompressing it on the fly if it starts with gzip, bz2 or xz magic bytes.
+    """
+    head = data.read(6)
+    data.seek(0)
+    kind = _detect_compression(head)
+    if kind is None:
+        return io.BufferedReader(_CountingReader(data), COMPRESSED_READ_BYTES)
+    module = importlib.import_module(kind)
+    if kind == "gzip":
+        stream = module.GzipFile(fileobj=data, mode="rb")
+        errors = (OSError, EOFError, module.zlib.error)
+    elif kind == "bz2":
+        stream = module.BZ2File(data)
+        errors = (OSError, EOFError)
+    else:
+        stream = module.LZMAFile(data)
+        errors = (module.LZMAError, EOFError)
+    return io.BufferedReader(_DecompressingReader(stream, data, errors), COMPRESSED_READ_BYTES)
+
+
+def open_csv(csv_file):
+    """Opens a csv file for reading as text, decompressing gzip, bz2 and xz
+        files as they are read.
+
+    The format is detected from the first bytes of the file, not its name.
+    Data is read and decompressed COMPRESSED_READ_BYTES at a time, so nothing
+    is ever decompressed to disk or held in memory in full.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A text file object, opened with newline="" for the csv module.
+    """
+    data = open(csv_file, 'rb', buffering=COMPRESSED_READ_BYTES)
+    try:
+        return io.TextIOWrapper(_open_binary(data), newline='')
+    except BaseException:
+        data.close()
+        raise
+
+
+def _read_rows(csv_file, skip_header=True):
+    """Yields [date, min, max] rows from an open csv file (or any iterable of
+        lines), skipping the header and any blank lines.
+    """
+    reader = csv.reader(csv_file)
+    if skip_header:
+        next(reader, None)
+    for row in reader:
+        if not row:
+            continue
+        yield [row[0], int(row[1]), int(row[2])]
+
+
+def iter_data_from_csv(csv_file, batch_size=None):
+    """Reads a csv file lazily, without holding the whole file in memory.
+
+    gzip, bz2 and xz files are decompressed as they are read (see open_csv).
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        batch_size: optional number of rows to group into each yielded list.
+    Yields:
+        One [date, min, max] list per (non-empty) line in the csv file, or lists
+        of up to batch_size such rows when batch_size is given.
+    """
+    with open_csv(csv_file) as csv_file:
+        rows = _read_rows(csv_file)
+        if batch_size is None:
+            yield from rows
+            return
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def load_data_from_csv(csv_file):
+    """Reads a csv file (plain, or compressed with gzip, bz2 or xz) and stores the data in a list.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A list of lists, where each sublist is a (non-empty) line in the csv file.
+    """
+    return list(iter_data_from_csv(csv_file))
+
+
+class WeatherRow:
+    """A lightweight view of a single day in a WeatherTable.
+
+    Indexing works like the lists returned by load_data_from_csv, so
+    row[0] is the timestamp, row[1] the minimum and row[2] the maximum.
+    """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, field):
+        if field < 0:
+            field += 3
+        if field == 0:
+            return self._table.timestamp(self._index)
+        if field == 1:
+            return self._table.mins[self._index]
+        if field == 2:
+            return self._table.maxs[self._index]
+        raise IndexError("weather row index out of range")
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        yield self[0]
+        yield self[1]
+        yield self[2]
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class WeatherTable:
+    """Column-oriented weather data backed by typed arrays.
+
+    Timestamps are stored as UTF-8 bytes in a single buffer with start and end
+    offsets, and the minimum and maximum temperatures are stored in signed
+    64-bit integer arrays. This uses a fraction of the memory of a list of
+    lists while still behaving like one for indexing and iteration. Tables
+    loaded by load_table_from_csv may use a memory-mapped file as the timestamp
+    buffer (and, for sidecars, as the columns), so nothing is decoded until it
+    is read.
+    """
+    __slots__ = ("_text", "_starts", "_ends", "mins", "maxs")
+
+    def __init__(self):
+        self._text = bytearray()
+        self._starts = array("q")
+        self._ends = array("q")
+        self.mins = array("q")
+        self.maxs = array("q")
+
+    @classmethod
+    def _from_columns(cls, text, starts, ends, mins, maxs):
+        """Wraps existing columns; starts and ends are offsets into text."""
+        table = cls.__new__(cls)
+        table._text = text
+        table._starts = starts
+        table._ends = ends
+        table.mins = mins
+        table.maxs = maxs
+        return table
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Builds a table from rows shaped like [timestamp, min, max].
+
+        Args:
+            rows: An iterable of rows, e.g. the output of load_data_from_csv.
+        Returns:
+            A WeatherTable holding the same data.
+        """
+        table = cls()
+        for row in rows:
+            table.append(row[0], row[1], row[2])
+        return table
+
+    def append(self, timestamp, min_temp, max_temp):
+        """Adds a day to the end of the table.
+
+        Args:
+            timestamp: An ISO date string.
+            min_temp: An integer minimum temperature.
+            max_temp: An integer maximum temperature.
+        """
+        if type(self._text) is not bytearray:
+            self._text = bytearray(self._text)
+        if type(self.mins) is not array:
+            self._starts = array("q", self._starts)
+            self._ends = array("q", self._ends)
+            self.mins = array("q", self.mins)
+            self.maxs = array("q", self.maxs)
+        start = len(self._text)
+        self._text += timestamp.encode("utf-8")
+        self._starts.append(start)
+        self._ends.append(len(self._text))
+        self.mins.append(min_temp)
+        self.maxs.append(max_temp)
+
+    def timestamp(self, index):
+        """Returns the ISO timestamp string of the day at the given index."""
+        return self._text[self._starts[index]:self._ends[index]].decode("utf-8")
+
+    @property
+    def timestamps(self):
+        """A list of every ISO timestamp string in the table."""
+        return [self.timestamp(i) for i in range(len(self))]
+
+    def to_list(self):
+        """Returns the data as a list of lists, like load_data_from_csv."""
+        return [[self.timestamp(i), self.mins[i], self.maxs[i]] for i in range(len(self))]
+
+    def __len__(self):
+        return len(self.mins)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return WeatherTable.from_rows(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("weather table index out of range")
+        return WeatherRow(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield WeatherRow(self, i)
+
+    def __repr__(self):
+        return f"<WeatherTable with {len(self)} days>"
+
+
+def load_table_from_csv(csv_file, sidecar=False):
+    """Reads a csv file and stores the data in a WeatherTable.
+
+    Files in the plain date,min,max layout are parsed straight from a memory
+    map; anything else (including gzip, bz2 and xz files) is read with the csv
+    module, exactly like load_data_from_csv.
+
+    With sidecar=True, the parsed columns are also saved to a binary file next to
+    the csv file (see weather.sidecar.sidecar_path). Later loads map that file instead of parsing
+    the csv again, as long as the csv file's size and modification time (or,
+    failing that, its SHA-256 hash) still match. Corrupt sidecars are rebuilt.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        sidecar: whether to read and write the binary sidecar cache.
+    Returns:
+        A WeatherTable, where each row is a (non-empty) line in the csv file.
+    """
+    if sidecar:
+        from weather import sidecar as sidecars
+        stat = os.stat(csv_file)
+        table = sidecars._read_sidecar(csv_file, stat)
+        if table is None:
+            table = load_table_from_csv(csv_file)
+            sidecars._write_sidecar(csv_file, table, stat)
+        return table
+
+    if csv_compression(csv_file) is None:
+        from weather import fastcsv
+        table = fastcsv._load_mapped_table(csv_file)
+        if table is not None:
+            return table
+    table = WeatherTable()
+    for date, min_temp, max_temp in iter_data_from_csv(csv_file):
+        table.append(date, min_temp, max_temp)
+    return table
+
+
+def find_min(weather_data):
+    """Calculates the minimum value in a list of numbers.
+
+    Large array columns and NumPy arrays are searched with NumPy when it is available.
+
+    Args:
+        weather_data: A list (or array column, or NumPy array) of numbers.
+    Returns:
+        The minimum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
+    """
+    if len(weather_data) == 0:
+        return() 
+    np = _numpy_backend(weather_data)
+    if np is not None:
+        values = _as_numeric_array(np, weather_data)
+        # argmin finds the first match, so search the reversed array for the last one.
+        min_position = len(values) - 1 - int(np.argmin(values[::-1]))
+        return (float(values[min_position]), min_position)
+
+    min_value = float(weather_data[0])
+    min_position = 0
+
+    for i in range (1, len(weather_data)):
+        value = float(weather_data[i])
+        if value <= min_value:
+            min_value = value
+            min_position = i
+
+    return (min_value, min_position)
+    
+    
+def find_max(weather_data):
+    """Calculates the maximum value in a list of numbers.
+
+    Large array columns and NumPy arrays are searched with NumPy when it is available.
+
+    Args:
+        weather_data: A list (or array column, or NumPy array) of numbers.
+    Returns:
+        The maximum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
+    """
+    if len(weather_data) == 0:
+        return() 
+    np = _numpy_backend(weather_data)
+    if np is not None:
+        values = _as_numeric_array(np, weather_data)
+        max_position = len(values) - 1 - int(np.argmax(values[::-1]))
+        return (float(values[max_position]), max_position)
+
+    max_value = float(weather_data[0]) 
+    max_position = 0 
+
+    for i in range (1, len(weather_data)): 
+        value = float(weather_data[i]) 
+        if value >= max_value: 
+            max_value = value 
+            max_position = i 
+    return (max_value, max_position)
+
+
+# The percentiles added to summaries when they are asked for: p5, median and p95.
+SUMMARY_PERCENTILES = (0.05, 0.5, 0.95)
+
+
+class SummaryAccumulator:
+    """Running summary statistics for weather data, built up in a single pass.
+
+    Tracks the number of days, the lowest minimum and highest maximum (with
+    their positions and timestamps) and the totals needed for the averages.
+    Ties follow find_min and find_max, so the *last* matching day wins.
+    Accumulators for consecutive chunks of data can be combined with merge.
+
+    With percentiles=True the lows and highs are also fed into a QuantileSketch
+    each (see weather.sketch), so medians and other percentiles can be reported
+    without keeping every value.
+    """
+    __slots__ = ("count", "min_value", "min_position", "min_timestamp",
+                 "max_value", "max_position", "max_timestamp",
+                 "min_total", "max_total", "low_sketch", "high_sketch")
+
+    def __init__(self, percentiles=False):
+        self.count = 0
+        self.min_value = None
+        self.min_position = None
+        self.min_timestamp = None
+        self.max_value = None
+        self.max_position = None
+        self.max_timestamp = None
+        self.min_total = 0.0
+        self.max_total = 0.0
+        self.low_sketch = None
+        self.high_sketch = None
+        if percentiles:
+            from weather.sketch import QuantileSketch
+            self.low_sketch = QuantileSketch()
+            self.high_sketch = QuantileSketch()
+
+    def update(self, row):
+        """Adds a single day to the summary.
+
+        Args:
+            row: A list like [timestamp, min, max].
+        Returns:
+            The accumulator, so calls can be chained.
+        """
+        low = float(row[1])
+        high = float(row[2])
+        if self.count == 0 or low <= self.min_value:
+            self.min_value = low
+            self.min_position = self.count
+            self.min_timestamp = row[0]
+        if self.count == 0 or high >= self.max_value:
+            self.max_value = high
+            self.max_position = self.count
+            self.max_timestamp = row[0]
+        self.min_total += low
+        self.max_total += high
+        self.count += 1
+        if self.low_sketch is not None:
+            self.low_sketch.add(low)
+            self.high_sketch.add(high)
+        return self
+
+    def update_batch(self, rows):
+        """Adds many days to the summary.
+
+        Args:
+            rows: An iterable of lists like [timestamp, min, max], or a WeatherTable.
+        Returns:
+            The accumulator, so calls can be chained.
+        """
+        if isinstance(rows, WeatherTable):
+            return self.merge(self._from_table(rows, self.low_sketch is not None))
+
+        add_low = add_high = None
+        if self.low_sketch is not None:
+            add_low, add_high = self.low_sketch.add, self.high_sketch.add
+        count = self.count
+        min_value, min_position, min_timestamp = self.min_value, self.min_position, self.min_timestamp
+        max_value, max_position, max_timestamp = self.max_value, self.max_position, self.max_timestamp
+        min_total, max_total = self.min_total, self.max_total
+        for row in rows:
+            low = float(row[1])
+            high = float(row[2])
+            if count == 0 or low <= min_value:
+                min_value, min_position, min_timestamp = low, count, row[0]
+            if count == 0 or high >= max_value:
+                max_value, max_position, max_timestamp = high, count, row[0]
+            min_total += low
+            max_total += high
+            count += 1
+            if add_low is not None:
+                add_low(low)
+                add_high(high)
+        self.count = count
+        self.min_value, self.min_position, self.min_timestamp = min_value, min_position, min_timestamp
+        self.max_value, self.max_position, self.max_timestamp = max_value, max_position, max_timestamp
+        self.min_total, self.max_total = min_total, max_total
+        return self
+
+    @classmethod
+    def _from_table(cls, table, percentiles=False):
+        """Summarises a WeatherTable straight from its min and max columns."""
+        result = cls(percentiles)
+        if not len(table):
+            return result
+        if percentiles:
+            result.low_sketch.add_many(table.mins)
+            result.high_sketch.add_many(table.maxs)
+        result.count = len(table)
+        result.min_value, result.min_position = find_min(table.mins)
+        result.min_timestamp = table.timestamp(result.min_position)
+        result.max_value, result.max_position = find_max(table.maxs)
+        result.max_timestamp = table.timestamp(result.max_position)
+        result.min_total = float(sum(table.mins))
+        result.max_total = float(sum(table.maxs))
+        return result
+
+    def merge(self, other):
+        """Adds the days summarised by another accumulator, which are taken to
+            come *after* the days already in this one.
+
+        Args:
+            other: A SummaryAccumulator for the following chunk of data.
+        Returns:
+            The accumulator, so calls can be chained.
+        """
+        if other.count == 0:
+            return self
+        if (self.low_sketch is None) != (other.low_sketch is None):
+            raise ValueError("cannot merge accumulators with and without percentiles")
+        if self.low_sketch is not None:
+            self.low_sketch.merge(other.low_sketch)
+            self.high_sketch.merge(other.high_sketch)
+        if self.count == 0 or other.min_value <= self.min_value:
+            self.min_value = other.min_value
+            self.min_position = self.count + other.min_position
+            self.min_timestamp = other.min_timestamp
+        if self.count == 0 or other.max_value >= self.max_value:
+            self.max_value = other.max_value
+            self.max_position = self.count + other.max_position
+            self.max_timestamp = other.max_timestamp
+        self.min_total += other.min_total
+        self.max_total += other.max_total
+        self.count += other.count
+        return self
+
+    def copy(self):
+        """Returns an independent copy of the accumulator."""
+        return SummaryAccumulator.from_dict(self.to_dict())
+
+    def to_dict(self):
+        """Returns the accumulator state as a JSON-serialisable dictionary."""
+        state = {name: getattr(self, name) for name in SummaryAccumulator.__slots__}
+        for name in ("low_sketch", "high_sketch"):
+            if state[name] is not None:
+                state[name] = state[name].to_dict()
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuilds an accumulator from the output of to_dict."""
+        accumulator = cls()
+        for name in cls.__slots__:
+            if name in ("low_sketch", "high_sketch"):
+                # Saved before percentiles were supported, or without them.
+                if state.get(name) is not None:
+                    from weather.sketch import QuantileSketch
+                    setattr(accumulator, name, QuantileSketch.from_dict(state[name]))
+            else:
+                setattr(accumulator, name, state[name])
+        return accumulator
+
+    @property
+    def mean_low(self):
+        """The average of the minimum temperatures."""
+        return self.min_total / self.count
+
+    @property
+    def mean_high(self):
+        """The average of the maximum temperatures."""
+        return self.max_total / self.count
+
+    def low_percentiles(self, fractions=SUMMARY_PERCENTILES):
+        """Returns the given percentiles of the minimum temperatures.
+
+        Args:
+            fractions: Fractions between 0 and 1, e.g. 0.5 for the median.
+        Returns:
+            A tuple with one value per fraction.
+        """
+        if self.low_sketch is None:
+            raise ValueError("percentiles were not enabled for this accumulator")
+        return tuple(self.low_sketch.quantile(fraction) for fraction in fractions)
+
+    def high_percentiles(self, fractions=SUMMARY_PERCENTILES):
+        """Returns the given percentiles of the maximum temperatures.
+
+        Args:
+            fractions: Fractions between 0 and 1, e.g. 0.5 for the median.
+        Returns:
+            A tuple with one value per fraction.
+        """
+        if self.high_sketch is None:
+            raise ValueError("percentiles were not enabled for this accumulator")
+        return tuple(self.high_sketch.quantile(fraction) for fraction in fractions)
+
+    def __repr__(self):
+        return f"<SummaryAccumulator of {self.count} days>"
+
+
+def format_summary(accumulator):
+    """Formats the summary text for a SummaryAccumulator.
+
+    Args:
+        accumulator: A SummaryAccumulator holding at least one day.
+    Returns:
+        A string containing the summary information.
+    """
+    if accumulator.count == 0:
+        raise ValueError("cannot summarise empty weather data")
+
+    # Finding the minimum
+    min_value = convert_f_to_c(accumulator.min_value)
+    min_date = convert_date(accumulator.min_timestamp)
+
+    overview = f"{accumulator.count} Day Overview\n"
+    line_low = f"  The lowest temperature will be {format_temperature(min_value)}, and will occur on {min_date}.\n" 
+
+    # Finding the maximum
+    max_value = convert_f_to_c(accumulator.max_value)
+    max_date = convert_date(accumulator.max_timestamp)
+    line_high = f"  The highest temperature will be {format_temperature(max_value)}, and will occur on {max_date}.\n"
+    
+    # Finding the averages
+    average_low = convert_f_to_c(accumulator.mean_low)
+    line_avg_low = f"  The average low this week is {format_temperature(average_low)}.\n"
+
+
+    average_high = convert_f_to_c(accumulator.mean_high)
+    line_avg_high = f"  The average high this week is {format_temperature(average_high)}.\n"
+
+    # Finding the percentiles, when they were recorded
+    lines_percentiles = ""
+    if accumulator.low_sketch is not None:
+        for name, values in (("low", accumulator.low_percentiles()), ("high", accumulator.high_percentiles())):
+            p5, median, p95 = (format_temperature(convert_f_to_c(value)) for value in values)
+            lines_percentiles += (f"  The median {name} this week is {median} "
+                                  f"(5th percentile {p5}, 95th percentile {p95}).\n")
+
+    # Create the final summary
+    summary = overview + line_low + line_high + line_avg_low + line_avg_high + lines_percentiles
+    return summary
+
+
+def generate_summary(weather_data, percentiles=False):
+    """Outputs a summary for the given weather data.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather
+            data, or a WeatherTable. Generators such as iter_data_from_csv are read once.
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs.
+    Returns:
+        A string containing the summary information.
+    """
+    return format_summary(SummaryAccumulator(percentiles).update_batch(weather_data))
+
+
+
+def iter_daily_summary(weather_data):
+    """Yields the daily summary for the given weather data one day at a time.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+    Yields:
+        A string containing the summary information for a single day.
+    """
+    for day in weather_data:
+        current_date = convert_date(day[0])
+        converted_min_temp = _format_f_as_c(day[1])
+        converted_max_temp = _format_f_as_c(day[2])
+        yield (f"---- {current_date} ----\n"
+               f"  Minimum Temperature: {converted_min_temp}\n"
+               f"  Maximum Temperature: {converted_max_temp}\n\n")
+
+
+def write_daily_summary(weather_data, out, days_per_write=512):
+    """Writes the daily summary for the given weather data to a file object.
+
+    Days are written in chunks, so the full report is never held in memory.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        out: A text file object (or io.StringIO) to write to.
+        days_per_write: How many days to buffer before each call to out.write.
+    Returns:
+        The number of days written.
+    """
+    days = 0
+    chunk = []
+    for block in iter_daily_summary(weather_data):
+        chunk.append(block)
+        if len(chunk) == days_per_write:
+            out.write("".join(chunk))
+            days += len(chunk)
+            chunk = []
+    if chunk:
+        out.write("".join(chunk))
+        days += len(chunk)
+    return days
+
+
+def generate_daily_summary(weather_data):
+    """Outputs a daily summary for the given weather data.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+    Returns:
+        A string containing the summary information.
+    """
+    return "".join(iter_daily_summary(weather_data))
@@ -0,0 +1,110 @@
+"""An optional LRU cache for convert_date."""
+import threading
+from collections import OrderedDict
+
+from weather import core
+
+
+class DateCache:
+    """A bounded least-recently-used cache of formatted dates.
+
+    Counts hits, misses and evictions so the size can be tuned for real
+    workloads. The cache is thread-safe and can be cleared between jobs.
+    """
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, iso_string, convert):
+        """Returns the cached conversion of iso_string, calling convert on a miss.
+
+        Args:
+            iso_string: An ISO date string.
+            convert: A function that formats iso_string when it is not cached.
+        Returns:
+            The formatted date.
+        """
+        with self._lock:
+            try:
+                result = self._entries[iso_string]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(iso_string)
+                self.hits += 1
+                return result
+        result = convert(iso_string)
+        with self._lock:
+            self._entries[iso_string] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def evict(self, iso_string):
+        """Removes a single date from the cache.
+
+        Args:
+            iso_string: An ISO date string.
+        Returns:
+            True if the date was cached, otherwise False.
+        """
+        with self._lock:
+            if self._entries.pop(iso_string, None) is None:
+                return False
+            self.evictions += 1
+            return True
+
+    def clear(self):
+        """Empties the cache and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """Returns the cache statistics as a dictionary."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def enable_date_cache(maxsize=4096):
+    """Turns on caching for convert_date, replacing any existing cache.
+
+    Args:
+        maxsize: The largest number of dates to keep.
+    Returns:
+        The new DateCache.
+    """
+    core._date_cache = DateCache(maxsize)
+    return core._date_cache
+
+
+def disable_date_cache():
+    """Turns off caching for convert_date and discards the cached dates."""
+    core._date_cache = None
+
+
+def date_cache_info():
+    """Returns the statistics of the convert_date cache, or None if it is off."""
+    cache = core._date_cache
+    if cache is None:
+        return None
+    return cache.info()
@@ -0,0 +1,82 @@
+"""A memory-mapped parser for plain date,min,max csv files."""
+import mmap
+import os
+from array import array
+from itertools import accumulate, repeat
+from operator import add
+
+from weather import core
+from weather.core import WeatherTable
+
+# How much of a memory-mapped csv file is split into lines at a time.
+MAPPED_CHUNK_BYTES = 16 * 1024 * 1024
+
+def _parse_mapped_lines(mapping, position, table):
+    """Parses plain date,min,max lines straight from a memory-mapped file.
+
+    Lines are split and converted a chunk at a time with bytes methods rather
+    than one field at a time, and timestamps are recorded as offsets into the
+    mapping instead of being decoded.
+
+    Args:
+        mapping: The mmap of the whole file.
+        position: The offset of the first line after the header.
+        table: A WeatherTable whose columns are extended in place.
+    Returns:
+        False if a line does not fit the plain layout, otherwise True.
+    """
+    size = len(mapping)
+    while position < size:
+        stop = mapping.find(b"\n", min(position + MAPPED_CHUNK_BYTES, size) - 1)
+        stop = size if stop == -1 else stop + 1
+        chunk = mapping[position:stop]
+        if chunk.count(b"\r") != chunk.count(b"\r\n"):
+            return False
+        lines = chunk.split(b"\n")
+        if not lines[-1]:
+            lines.pop()
+        line_starts = list(accumulate(map((1).__add__, map(len, lines)), initial=position))
+        line_starts.pop()
+        if b"" in lines or b"\r" in lines:
+            kept = [i for i, line in enumerate(lines) if line and line != b"\r"]
+            lines = [lines[i] for i in kept]
+            line_starts = [line_starts[i] for i in kept]
+        if list(map(bytes.count, lines, repeat(b","))).count(2) != len(lines):
+            return False
+        fields = b",".join(lines).split(b",")
+        try:
+            table.mins.extend(map(int, fields[1::3]))
+            table.maxs.extend(map(int, fields[2::3]))
+        except ValueError:
+            return False
+        table._starts.extend(line_starts)
+        table._ends.extend(map(add, line_starts, map(len, fields[0::3])))
+        position = stop
+    return True
+
+
+def _load_mapped_table(csv_file):
+    """Loads a plain date,min,max csv file through mmap, or returns None if the
+        file needs the full csv module (quotes, stray carriage returns, bad rows).
+    """
+    with open(csv_file, 'rb') as data:
+        if os.fstat(data.fileno()).st_size == 0:
+            return None
+        mapping = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapping.find(b'"') != -1:
+        mapping.close()
+        return None
+    # Without a "\n" the file may use lone "\r" line endings, which only the csv
+    # module splits correctly. _parse_mapped_lines checks the lines after the header.
+    header_end = mapping.find(b"\n")
+    header = mapping[:header_end + 1]
+    if header_end == -1 or header.count(b"\r") != header.count(b"\r\n"):
+        mapping.close()
+        return None
+    table = WeatherTable._from_columns(mapping, array("q"), array("q"), array("q"), array("q"))
+    if not _parse_mapped_lines(mapping, header_end + 1, table):
+        mapping.close()
+        return None
+    if core._byte_counter is not None:
+        core._byte_counter("parse", len(mapping))
+    return table
@@ -0,0 +1,106 @@
+"""Summaries of weather data grouped by ISO week, month or year."""
+from weather.core import _MONTH_TEXT, SummaryAccumulator, _parse_iso_date, format_summary
+
+PERIODS = ("week", "month", "year")
+
+
+def period_key(iso_string, period):
+    """Returns the calendar period a timestamp falls in, as a sortable tuple.
+
+    Periods follow the calendar date written in the timestamp.
+
+    Args:
+        iso_string: An ISO date string.
+        period: "week" (ISO weeks, which start on Monday), "month" or "year".
+    Returns:
+        (ISO year, week), (year, month) or (year,).
+    """
+    day = _parse_iso_date(iso_string)
+    if period == "week":
+        return tuple(day.isocalendar()[:2])
+    if period == "month":
+        return (day.year, day.month)
+    if period == "year":
+        return (day.year,)
+    raise ValueError(f"unknown period {period!r} (expected one of {', '.join(PERIODS)})")
+
+
+def period_label(key, period):
+    """Formats a key from period_key, e.g. "Week 27 of 2021", "July 2021" or "2021"."""
+    if period == "week":
+        return f"Week {key[1]} of {key[0]}"
+    if period == "month":
+        return _MONTH_TEXT[key[1]] + str(key[0])
+    return str(key[0])
+
+
+def summarize_by(weather_data, period="week", percentiles=False):
+    """Summarises weather data per calendar period in a single pass.
+
+    Rows are added to one SummaryAccumulator per period as they are read, so
+    the input can be a generator such as iter_data_from_csv and does not need
+    to be sorted.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        period: "week", "month" or "year".
+        percentiles: whether each summary also tracks percentiles.
+    Returns:
+        A list of (key, SummaryAccumulator) pairs in chronological order, where
+        key comes from period_key.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"unknown period {period!r} (expected one of {', '.join(PERIODS)})")
+    groups = {}
+    for row in weather_data:
+        key = period_key(row[0], period)
+        accumulator = groups.get(key)
+        if accumulator is None:
+            accumulator = groups[key] = SummaryAccumulator(percentiles)
+        accumulator.update(row)
+    return sorted(groups.items())
+
+
+def iter_grouped_summary(weather_data, period="week", percentiles=False):
+    """Yields the summary of each calendar period in chronological order.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        period: "week", "month" or "year".
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs.
+    Yields:
+        A string with a "==== <period> ====" heading followed by the summary.
+    """
+    for key, accumulator in summarize_by(weather_data, period, percentiles):
+        yield f"==== {period_label(key, period)} ====\n{format_summary(accumulator)}\n"
+
+
+def write_grouped_summary(weather_data, out, period="week", percentiles=False):
+    """Writes the summary of each calendar period to a file object.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        out: A text file object (or io.StringIO) to write to.
+        period: "week", "month" or "year".
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs.
+    Returns:
+        The number of periods written.
+    """
+    periods = 0
+    for block in iter_grouped_summary(weather_data, period, percentiles):
+        out.write(block)
+        periods += 1
+    return periods
+
+
+def generate_grouped_summary(weather_data, period="week", percentiles=False):
+    """Outputs a summary for each calendar period of the given weather data.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        period: "week", "month" or "year".
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs.
+    Returns:
+        A string containing the summary information.
+    """
+    return "".join(iter_grouped_summary(weather_data, period, percentiles))
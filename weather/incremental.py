@@ -0,0 +1,148 @@
+"""Incremental summaries for csv files that grow by appending rows."""
+import hashlib
+import json
+import os
+
+from weather.core import SummaryAccumulator, _detect_compression, _read_rows, format_summary
+
+# State files written by update_incremental_summary, and how much of the start
+# and the end of the already-summarised part of the csv file is hashed to
+# detect rewrites (unless the whole of it is hashed, with full_check=True).
+INCREMENTAL_SUFFIX = ".summary-state.json"
+PREFIX_CHECK_BYTES = 64 * 1024
+
+
+def incremental_state_path(csv_file):
+    """Returns the default path of the incremental summary state for a csv file."""
+    return os.fspath(csv_file) + INCREMENTAL_SUFFIX
+
+
+def _prefix_digest(data, offset, full=False):
+    """Hashes the start and the end of the first offset bytes of a binary file,
+        or all of them when full is true.
+    """
+    digest = hashlib.sha256()
+    data.seek(0)
+    if full:
+        remaining = offset
+        while remaining > 0:
+            block = data.read(min(remaining, 1024 * 1024))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+        return digest.hexdigest()
+    digest.update(data.read(min(offset, PREFIX_CHECK_BYTES)))
+    data.seek(max(0, offset - PREFIX_CHECK_BYTES))
+    digest.update(data.read(offset - data.tell()))
+    return digest.hexdigest()
+
+
+def _load_incremental_state(state_file):
+    """Reads a saved incremental state, or returns None if it is missing or corrupt."""
+    try:
+        with open(state_file, encoding="utf-8") as state:
+            saved = json.load(state)
+        return (saved["offset"], saved["prefix_sha256"], saved.get("full_check", False),
+                SummaryAccumulator.from_dict(saved["summary"]))
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _save_incremental_state(state_file, offset, prefix_sha256, full_check, accumulator):
+    """Writes the incremental state atomically."""
+    temporary = f"{state_file}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as state:
+        json.dump({"offset": offset, "prefix_sha256": prefix_sha256, "full_check": full_check,
+                   "summary": accumulator.to_dict()}, state)
+    os.replace(temporary, state_file)
+
+
+def _complete_lines(data, progress):
+    """Yields decoded newline-terminated lines, counting their bytes in
+        progress["offset"] and keeping any unterminated last line in progress["pending"].
+    """
+    for line in data:
+        if not line.endswith(b"\n"):
+            progress["pending"] = line
+            return
+        progress["offset"] += len(line)
+        yield line.decode("utf-8")
+
+
+def update_incremental_summary(csv_file, state_file=None, full_check=False):
+    """Summarises a csv file that grows by having rows appended to it.
+
+    The byte offset of the last summarised row and the running SummaryAccumulator
+    are saved in a state file, so each call only reads the rows appended since
+    the previous call. If the file has shrunk, or a hash of the first and last
+    PREFIX_CHECK_BYTES of the already summarised bytes no longer matches, the
+    summary is rebuilt from the start.
+
+    That check costs the same however large the file is, but it misses edits
+    that keep the length and only touch the middle of a large file (e.g. a
+    corrected reading). Pass full_check=True to hash every summarised byte
+    instead: that reads the whole file on each call, but hashing is still far
+    cheaper than parsing it again.
+
+    A last line without a trailing newline may still be being written, so it is
+    included in the result but not saved in the state; it is read again next time.
+
+    Compressed (gzip, bz2 or xz) files cannot be resumed from a byte offset, so
+    they are refused with a ValueError.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        state_file: where to keep the state. Defaults to incremental_state_path(csv_file).
+        full_check: whether to hash all of the already summarised bytes. A state
+            saved with the other setting is rebuilt.
+    Returns:
+        A SummaryAccumulator for the whole file.
+    """
+    if state_file is None:
+        state_file = incremental_state_path(csv_file)
+    state = _load_incremental_state(state_file)
+
+    with open(csv_file, 'rb') as data:
+        if _detect_compression(data.read(6)) is not None:
+            raise ValueError(f"{csv_file} is compressed; incremental summaries need a plain csv file")
+        size = os.fstat(data.fileno()).st_size
+        if (state is not None and state[0] <= size and state[2] == full_check
+                and _prefix_digest(data, state[0], full_check) == state[1]):
+            offset, _, _, accumulator = state
+        else:
+            offset, accumulator = 0, SummaryAccumulator()
+
+        data.seek(offset)
+        if offset == 0:
+            header = data.readline()
+            if not header.endswith(b"\n"):
+                return accumulator
+            offset = len(header)
+
+        progress = {"offset": offset, "pending": None}
+        accumulator.update_batch(_read_rows(_complete_lines(data, progress), skip_header=False))
+        offset = progress["offset"]
+        prefix_sha256 = _prefix_digest(data, offset, full_check)
+
+    _save_incremental_state(state_file, offset, prefix_sha256, full_check, accumulator)
+    if progress["pending"] is None:
+        return accumulator
+    try:
+        return accumulator.copy().update_batch(
+            _read_rows([progress["pending"].decode("utf-8")], skip_header=False))
+    except (ValueError, IndexError):
+        return accumulator
+
+
+def generate_incremental_summary(csv_file, state_file=None, full_check=False):
+    """Outputs a summary for a growing csv file, reading only newly appended rows.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        state_file: where to keep the state. Defaults to incremental_state_path(csv_file).
+        full_check: whether to hash all of the already summarised bytes (see update_incremental_summary).
+    Returns:
+        A string containing the summary information.
+    """
+    return format_summary(update_incremental_summary(csv_file, state_file, full_check))
@@ -0,0 +1,206 @@
+"""Answering many date-range summaries over the same loaded data."""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from itertools import accumulate, chain
+
+from weather import core
+from weather.core import SummaryAccumulator, WeatherTable, _as_numeric_array, _get_numpy, format_summary
+
+
+def _day_number(value):
+    """Returns the proleptic ordinal of a date, datetime or ISO string's calendar date."""
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    return date.fromisoformat(value[:10]).toordinal()
+
+
+def _number(value):
+    """Returns whole numbers unchanged and anything else (e.g. a string) as a float."""
+    return value if type(value) is int else float(value)
+
+
+def _sparse_table(values, lowest):
+    """Builds the levels of a sparse table of positions.
+
+    Level k holds, for every i, the position of the lowest (or highest) value
+    in values[i:i + 2**k], taking the *last* position on ties. Large tables
+    are built with NumPy when it is available: unlike a single find_min, the
+    list is converted once and then read by every level.
+    """
+    n = len(values)
+    code = "i" if n < 2 ** 31 else "q"
+    levels = [array(code, range(n))]
+    width = 1
+    np = _get_numpy() if n >= core.NUMPY_THRESHOLD else None
+    if np is not None:
+        numbers = _as_numeric_array(np, values)
+        previous = np.arange(n, dtype=np.int32 if code == "i" else np.int64)
+        while 2 * width <= n:
+            a = previous[:len(previous) - width]
+            b = previous[width:]
+            if lowest:
+                previous = np.where(numbers[b] <= numbers[a], b, a)
+            else:
+                previous = np.where(numbers[b] >= numbers[a], b, a)
+            levels.append(array(code, previous.tobytes()))
+            width *= 2
+        return levels
+    while 2 * width <= n:
+        previous = levels[-1]
+        pairs = zip(previous, previous[width:])
+        if lowest:
+            level = [b if values[b] <= values[a] else a for a, b in pairs]
+        else:
+            level = [b if values[b] >= values[a] else a for a, b in pairs]
+        levels.append(array(code, level))
+        width *= 2
+    return levels
+
+
+class WeatherIndex:
+    """A read-only index for summarising date ranges of weather data.
+
+    Built once in O(n log n), after which the lowest and highest temperatures
+    of any range come from sparse tables and the averages from prefix sums,
+    so each query takes O(log n) to find the range and O(1) to summarise it.
+    Ties go to the *last* matching day, like find_min and find_max.
+
+    The data must be in chronological order. Ranges are chosen by calendar
+    date, as written in each timestamp, and include both end dates.
+    """
+
+    def __init__(self, weather_data):
+        """Builds the index.
+
+        Args:
+            weather_data: A list of lists like load_data_from_csv returns, or a WeatherTable.
+        """
+        if isinstance(weather_data, WeatherTable):
+            self.timestamps = weather_data.timestamps
+            self.mins = list(weather_data.mins)
+            self.maxs = list(weather_data.maxs)
+        else:
+            self.timestamps = [day[0] for day in weather_data]
+            self.mins = [_number(day[1]) for day in weather_data]
+            self.maxs = [_number(day[2]) for day in weather_data]
+        self.days = array("q", map(_day_number, self.timestamps))
+        for i in range(1, len(self.days)):
+            if self.days[i] < self.days[i - 1]:
+                raise ValueError(f"weather data is not in date order at {self.timestamps[i]}")
+
+        # Whole numbers add up exactly, so their prefix sums give the same
+        # averages as adding up the range one day at a time. Other numbers
+        # are summed directly to keep the output identical to generate_summary.
+        self._exact_sums = all(type(value) is int for value in chain(self.mins, self.maxs))
+        if self._exact_sums:
+            self._min_sums = [0] + list(accumulate(self.mins))
+            self._max_sums = [0] + list(accumulate(self.maxs))
+        self._min_table = _sparse_table(self.mins, lowest=True)
+        self._max_table = _sparse_table(self.maxs, lowest=False)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def positions(self, start=None, end=None):
+        """Returns the positions covered by a date range.
+
+        Args:
+            start: The first date (a date, datetime or ISO string), or None for the first day.
+            end: The last date, included, or None for the last day.
+        Returns:
+            A (first, stop) pair, so the days are weather_data[first:stop].
+        """
+        first = 0 if start is None else bisect_left(self.days, _day_number(start))
+        stop = len(self.days) if end is None else bisect_right(self.days, _day_number(end))
+        return first, max(first, stop)
+
+    def _min_position(self, first, stop):
+        """Returns the position of the last lowest minimum in mins[first:stop]."""
+        level = (stop - first).bit_length() - 1
+        left = self._min_table[level][first]
+        right = self._min_table[level][stop - (1 << level)]
+        return right if self.mins[right] <= self.mins[left] else left
+
+    def _max_position(self, first, stop):
+        """Returns the position of the last highest maximum in maxs[first:stop]."""
+        level = (stop - first).bit_length() - 1
+        left = self._max_table[level][first]
+        right = self._max_table[level][stop - (1 << level)]
+        return right if self.maxs[right] >= self.maxs[left] else left
+
+    def range_min(self, start=None, end=None):
+        """Finds the lowest minimum temperature in a date range.
+
+        Returns:
+            The minimum value and its position in the whole data, like find_min,
+            or an empty tuple if no days fall in the range.
+        """
+        first, stop = self.positions(start, end)
+        if first == stop:
+            return ()
+        position = self._min_position(first, stop)
+        return (float(self.mins[position]), position)
+
+    def range_max(self, start=None, end=None):
+        """Finds the highest maximum temperature in a date range.
+
+        Returns:
+            The maximum value and its position in the whole data, like find_max,
+            or an empty tuple if no days fall in the range.
+        """
+        first, stop = self.positions(start, end)
+        if first == stop:
+            return ()
+        position = self._max_position(first, stop)
+        return (float(self.maxs[position]), position)
+
+    def _totals(self, first, stop):
+        """Returns the totals of the minimum and maximum temperatures in a range."""
+        if self._exact_sums:
+            return (float(self._min_sums[stop] - self._min_sums[first]),
+                    float(self._max_sums[stop] - self._max_sums[first]))
+        min_total = 0.0
+        max_total = 0.0
+        for i in range(first, stop):
+            min_total += float(self.mins[i])
+            max_total += float(self.maxs[i])
+        return min_total, max_total
+
+    def range_accumulator(self, start=None, end=None):
+        """Returns a SummaryAccumulator for a date range, with positions
+            counted from the first day of the range.
+        """
+        first, stop = self.positions(start, end)
+        accumulator = SummaryAccumulator()
+        if first == stop:
+            return accumulator
+        accumulator.count = stop - first
+        position = self._min_position(first, stop)
+        accumulator.min_value = float(self.mins[position])
+        accumulator.min_position = position - first
+        accumulator.min_timestamp = self.timestamps[position]
+        position = self._max_position(first, stop)
+        accumulator.max_value = float(self.maxs[position])
+        accumulator.max_position = position - first
+        accumulator.max_timestamp = self.timestamps[position]
+        accumulator.min_total, accumulator.max_total = self._totals(first, stop)
+        return accumulator
+
+    def summarize_range(self, start=None, end=None):
+        """Outputs a summary for a date range.
+
+        The text is identical to generate_summary on the same days.
+
+        Args:
+            start: The first date (a date, datetime or ISO string), or None for the first day.
+            end: The last date, included, or None for the last day.
+        Returns:
+            A string containing the summary information.
+        """
+        return format_summary(self.range_accumulator(start, end))
+
+    def __repr__(self):
+        return f"<WeatherIndex of {len(self)} days>"
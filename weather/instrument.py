@@ -0,0 +1,203 @@
+"""Opt-in timing of each stage of the summary pipeline."""
+import functools
+import importlib
+import inspect
+import sys
+import threading
+import time
+
+# The functions (and SummaryAccumulator methods) timed for each pipeline stage
+# while instrumentation is enabled, as "module:name".
+INSTRUMENTED_STAGES = {
+    "decompress": ("weather.core:_DecompressingReader.readinto",),
+    "parse": ("weather.core:_read_rows", "weather.fastcsv:_load_mapped_table",
+              "weather.sidecar:_read_sidecar"),
+    "convert_date": ("weather.core:convert_date",),
+    "convert_f_to_c": ("weather.core:convert_f_to_c", "weather.core:convert_f_to_c_many",
+                       "weather.core:_format_f_as_c"),
+    "aggregate": ("weather.core:find_min", "weather.core:find_max", "weather.core:calculate_mean",
+                  "weather.core:SummaryAccumulator.update",
+                  "weather.core:SummaryAccumulator.update_batch",
+                  "weather.core:SummaryAccumulator.merge"),
+    "render": ("weather.core:format_summary", "weather.core:iter_daily_summary",
+               "weather.render:JsonLinesRenderer.write_summary", "weather.render:JsonLinesRenderer.write_daily",
+               "weather.render:CsvRenderer.write_summary", "weather.render:CsvRenderer.write_daily"),
+}
+
+_stage_stats = {}
+_stage_bytes = {}
+_stage_lock = threading.Lock()
+_stage_local = threading.local()
+_uninstrumented = []
+_timed_functions = {}
+
+
+def _stage_enter(stage):
+    """Starts timing a stage, pausing whichever stage was running on this thread."""
+    now_wall = time.perf_counter()
+    now_cpu = time.thread_time()
+    stack = getattr(_stage_local, "stack", None)
+    if stack is None:
+        stack = _stage_local.stack = []
+    elif stack:
+        _stage_charge(stack[-1], now_wall - _stage_local.wall, now_cpu - _stage_local.cpu, 0)
+    stack.append(stage)
+    _stage_local.wall = now_wall
+    _stage_local.cpu = now_cpu
+
+
+def _stage_leave(calls):
+    """Stops timing the current stage and resumes the one it interrupted."""
+    now_wall = time.perf_counter()
+    now_cpu = time.thread_time()
+    stage = _stage_local.stack.pop()
+    _stage_charge(stage, now_wall - _stage_local.wall, now_cpu - _stage_local.cpu, calls)
+    _stage_local.wall = now_wall
+    _stage_local.cpu = now_cpu
+
+
+def _stage_charge(stage, wall, cpu, calls):
+    """Adds time (and calls) to a stage's totals."""
+    with _stage_lock:
+        totals = _stage_stats.setdefault(stage, [0, 0.0, 0.0])
+        totals[0] += calls
+        totals[1] += wall
+        totals[2] += cpu
+
+
+def _count_bytes(stage, count):
+    """Adds to the bytes a stage has processed (set as weather.core._byte_counter)."""
+    with _stage_lock:
+        _stage_bytes[stage] = _stage_bytes.get(stage, 0) + count
+
+
+def _timed(stage, function):
+    """Wraps a function (or generator function) so its own time is charged to a stage."""
+    if inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def timed_generator(*args, **kwargs):
+            _stage_enter(stage)
+            try:
+                generator = function(*args, **kwargs)
+            finally:
+                _stage_leave(1)
+            try:
+                while True:
+                    _stage_enter(stage)
+                    try:
+                        value = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        _stage_leave(0)
+                    yield value
+            finally:
+                generator.close()
+        return timed_generator
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        _stage_enter(stage)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _stage_leave(1)
+    return timed
+
+
+def enable_instrumentation():
+    """Starts recording call counts and wall and CPU time for each pipeline stage,
+        clearing any earlier totals.
+
+    Time is charged to the innermost running stage only, so nested stages (e.g.
+    convert_date inside format_summary) are not counted twice. Only work done
+    in this process is recorded. When instrumentation is disabled the original
+    functions are restored, so it costs nothing.
+
+    The bytes read by the decompress and parse stages are counted too, so
+    their throughput can be compared (parse counts the decompressed bytes).
+    """
+    from weather import core
+    with _stage_lock:
+        _stage_stats.clear()
+        _stage_bytes.clear()
+    core._byte_counter = _count_bytes
+    if _uninstrumented or _timed_functions:
+        return
+    for stage, targets in INSTRUMENTED_STAGES.items():
+        for target in targets:
+            module_name, _, name = target.partition(":")
+            module = importlib.import_module(module_name)
+            owner, _, attribute = name.rpartition(".")
+            if owner:
+                cls = getattr(module, owner)
+                original = getattr(cls, attribute)
+                _uninstrumented.append((cls, attribute, original))
+                setattr(cls, attribute, _timed(stage, original))
+            else:
+                original = getattr(module, attribute)
+                timed = _timed(stage, original)
+                _timed_functions[id(timed)] = (timed, original)
+                _replace_functions({id(original): timed})
+
+
+def disable_instrumentation():
+    """Stops recording stage timings and restores the original functions."""
+    from weather import core
+    core._byte_counter = None
+    while _uninstrumented:
+        cls, attribute, original = _uninstrumented.pop()
+        setattr(cls, attribute, original)
+    _replace_functions({key: original for key, (_, original) in _timed_functions.items()})
+    _timed_functions.clear()
+
+
+def _replace_functions(replacements):
+    """Swaps functions in every loaded weather module, including their from-imports.
+
+    Args:
+        replacements: A dictionary mapping the id of each function to its replacement.
+    """
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == "weather" or name.startswith("weather.")):
+            continue
+        namespace = vars(module)
+        for key, value in list(namespace.items()):
+            replacement = replacements.get(id(value))
+            if replacement is not None:
+                namespace[key] = replacement
+
+
+def instrumentation_stats():
+    """Returns the recorded stage timings.
+
+    Returns:
+        A dictionary mapping each stage name to a dictionary of "calls",
+        "wall_seconds", "cpu_seconds", "bytes" and "bytes_per_second" (bytes
+        are only counted for the decompress and parse stages).
+    """
+    with _stage_lock:
+        stats = {}
+        for stage, (calls, wall, cpu) in _stage_stats.items():
+            count = _stage_bytes.get(stage, 0)
+            stats[stage] = {"calls": calls, "wall_seconds": wall, "cpu_seconds": cpu, "bytes": count,
+                            "bytes_per_second": count / wall if wall > 0 else 0.0}
+        return stats
+
+
+def instrumentation_prometheus():
+    """Returns the recorded stage timings in the Prometheus text exposition format."""
+    stats = instrumentation_stats()
+    metrics = [
+        ("weather_stage_calls_total", "calls", "Calls into each weather summary pipeline stage."),
+        ("weather_stage_wall_seconds_total", "wall_seconds", "Wall-clock time spent in each stage."),
+        ("weather_stage_cpu_seconds_total", "cpu_seconds", "CPU time spent in each stage."),
+        ("weather_stage_bytes_total", "bytes", "Bytes read by each stage (decompressed bytes for parse)."),
+    ]
+    lines = []
+    for metric, field, description in metrics:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} counter")
+        for stage in sorted(stats):
+            lines.append(f'{metric}{{stage="{stage}"}} {stats[stage][field]!r}')
+    return "\n".join(lines) + "\n"
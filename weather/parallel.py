@@ -0,0 +1,108 @@
+"""Summarising a single large csv file across several processes."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from weather.core import SummaryAccumulator, _read_rows, csv_compression, format_summary, iter_data_from_csv
+
+# Shards smaller than this are not worth the cost of a worker process.
+SHARD_MIN_BYTES = 4 * 1024 * 1024
+
+def _shard_boundaries(csv_file, shards):
+    """Splits a csv file into byte ranges that start and end on line boundaries.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        shards: the number of ranges to aim for.
+    Returns:
+        A list of byte offsets; shard i covers offsets[i] up to offsets[i + 1].
+        The header line is never part of a shard.
+    """
+    size = os.path.getsize(csv_file)
+    with open(csv_file, 'rb') as data:
+        data.readline()
+        boundaries = [data.tell()]
+        span = size - boundaries[0]
+        for i in range(1, shards):
+            target = boundaries[0] + span * i // shards
+            if target <= boundaries[-1]:
+                continue
+            data.seek(target - 1)
+            data.readline()
+            position = data.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+    boundaries.append(max(size, boundaries[-1]))
+    return boundaries
+
+
+def _iter_byte_range(data, length):
+    """Yields decoded lines from a binary file until length bytes are consumed."""
+    while length > 0:
+        line = data.readline()
+        if not line:
+            return
+        length -= len(line)
+        yield line.decode("utf-8")
+
+
+def _summarize_shard(csv_file, start, end, percentiles=False):
+    """Summarises the rows of a csv file between two line-aligned byte offsets."""
+    accumulator = SummaryAccumulator(percentiles)
+    with open(csv_file, 'rb') as data:
+        data.seek(start)
+        lines = _iter_byte_range(data, end - start)
+        accumulator.update_batch(_read_rows(lines, skip_header=False))
+    return accumulator
+
+
+def summarize_csv(csv_file, workers=None, min_shard_bytes=SHARD_MIN_BYTES, percentiles=False):
+    """Summarises a csv file, splitting large files across worker processes.
+
+    The file is cut into line-aligned byte ranges, each range is summarised in
+    its own process and the partial results are merged back in file order, so
+    the result is identical to summarising the whole file in one pass.
+
+    gzip, bz2 and xz files cannot be split by byte offset, so they are
+    decompressed and summarised in a single streaming pass instead.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        workers: the number of processes to use. Defaults to the number of CPUs.
+        min_shard_bytes: the smallest byte range worth giving to a process.
+        percentiles: whether to track percentiles (each shard keeps its own
+            sketches, which are merged with the rest of the summary).
+    Returns:
+        A SummaryAccumulator for the whole file.
+    """
+    if csv_compression(csv_file) is not None:
+        return SummaryAccumulator(percentiles).update_batch(iter_data_from_csv(csv_file))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    size = os.path.getsize(csv_file)
+    shards = max(1, min(workers, size // max(1, min_shard_bytes)))
+    boundaries = _shard_boundaries(csv_file, shards)
+    if len(boundaries) <= 2:
+        return _summarize_shard(csv_file, boundaries[0], boundaries[-1], percentiles)
+
+    accumulator = SummaryAccumulator(percentiles)
+    with ProcessPoolExecutor(max_workers=len(boundaries) - 1) as executor:
+        partials = executor.map(_summarize_shard, repeat(csv_file), boundaries[:-1], boundaries[1:],
+                                repeat(percentiles))
+        for partial in partials:
+            accumulator.merge(partial)
+    return accumulator
+
+
+def generate_summary_from_csv(csv_file, workers=None, percentiles=False):
+    """Outputs a summary for the weather data in a csv file, using several
+        processes for large files.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        workers: the number of processes to use. Defaults to the number of CPUs.
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs.
+    Returns:
+        A string containing the summary information.
+    """
+    return format_summary(summarize_csv(csv_file, workers, percentiles=percentiles))
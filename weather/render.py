@@ -0,0 +1,185 @@
+"""Streaming renderers that write summaries as text, JSON Lines or csv."""
+import csv
+import json
+
+from weather.core import SummaryAccumulator, convert_f_to_c, format_summary, iter_daily_summary
+
+# The columns written by the machine-readable renderers, in order.
+SUMMARY_FIELDS = ("days", "lowest_c", "lowest_date", "highest_c", "highest_date", "mean_low_c", "mean_high_c")
+PERCENTILE_FIELDS = ("low_p5_c", "low_median_c", "low_p95_c", "high_p5_c", "high_median_c", "high_p95_c")
+DAILY_FIELDS = ("date", "min_c", "max_c")
+
+
+def summary_fields(accumulator):
+    """Returns the names of the values in a summary: SUMMARY_FIELDS, followed by
+        PERCENTILE_FIELDS if the accumulator tracked percentiles.
+    """
+    if accumulator.low_sketch is None:
+        return SUMMARY_FIELDS
+    return SUMMARY_FIELDS + PERCENTILE_FIELDS
+
+
+def summary_values(accumulator):
+    """Returns the values shown in a summary, converted to Celcius.
+
+    Dates are left as the ISO timestamps from the csv file.
+
+    Args:
+        accumulator: A SummaryAccumulator holding at least one day.
+    Returns:
+        A tuple of values in the order of summary_fields(accumulator).
+    """
+    if accumulator.count == 0:
+        raise ValueError("cannot summarise empty weather data")
+    values = (accumulator.count,
+              convert_f_to_c(accumulator.min_value), accumulator.min_timestamp,
+              convert_f_to_c(accumulator.max_value), accumulator.max_timestamp,
+              convert_f_to_c(accumulator.mean_low), convert_f_to_c(accumulator.mean_high))
+    if accumulator.low_sketch is None:
+        return values
+    percentiles = accumulator.low_percentiles() + accumulator.high_percentiles()
+    return values + tuple(convert_f_to_c(value) for value in percentiles)
+
+
+def _iter_daily_values(weather_data):
+    """Yields (date, min_c, max_c) for each day of weather data."""
+    for day in weather_data:
+        yield day[0], convert_f_to_c(day[1]), convert_f_to_c(day[2])
+
+
+class TextRenderer:
+    """Writes the same human-readable text as generate_summary and generate_daily_summary.
+
+    The source file name is not part of the text, so source is ignored.
+    """
+
+    suffix = ".txt"
+    content_type = "text/plain; charset=utf-8"
+
+    def write_summary(self, accumulator, out, source=None):
+        out.write(format_summary(accumulator))
+
+    def write_daily(self, weather_data, out, source=None):
+        days = 0
+        for block in iter_daily_summary(weather_data):
+            out.write(block)
+            days += 1
+        return days
+
+
+class JsonLinesRenderer:
+    """Writes one JSON object per line, keyed by summary_fields or DAILY_FIELDS,
+        with a leading "file" key when a source is given.
+    """
+
+    suffix = ".jsonl"
+    content_type = "application/x-ndjson"
+
+    def write_summary(self, accumulator, out, source=None):
+        record = {} if source is None else {"file": source}
+        record.update(zip(summary_fields(accumulator), summary_values(accumulator)))
+        out.write(json.dumps(record) + "\n")
+
+    def write_daily(self, weather_data, out, source=None):
+        prefix = "{" if source is None else f'{{"file": {json.dumps(source)}, '
+        days = 0
+        for date, min_c, max_c in _iter_daily_values(weather_data):
+            # Celcius values are always finite floats, whose repr is also their JSON text.
+            out.write(f'{prefix}"date": {json.dumps(date)}, "min_c": {min_c!r}, "max_c": {max_c!r}}}\n')
+            days += 1
+        return days
+
+
+class CsvRenderer:
+    """Writes a header row followed by one csv row per summary or day, with a
+        leading "file" column when a source is given.
+    """
+
+    suffix = ".csv"
+    content_type = "text/csv; charset=utf-8"
+
+    def write_summary(self, accumulator, out, source=None):
+        writer = csv.writer(out, lineterminator="\n")
+        if source is None:
+            writer.writerow(summary_fields(accumulator))
+            writer.writerow(summary_values(accumulator))
+        else:
+            writer.writerow(("file",) + summary_fields(accumulator))
+            writer.writerow((source,) + summary_values(accumulator))
+
+    def write_daily(self, weather_data, out, source=None):
+        writer = csv.writer(out, lineterminator="\n")
+        if source is None:
+            writer.writerow(DAILY_FIELDS)
+        else:
+            writer.writerow(("file",) + DAILY_FIELDS)
+        days = 0
+        for values in _iter_daily_values(weather_data):
+            writer.writerow(values if source is None else (source,) + values)
+            days += 1
+        return days
+
+
+# The renderer class for each output format. Add an entry here to support
+# another format everywhere that takes a format name (the batch command
+# also passes a source argument when writing combined jsonl or csv output).
+RENDERERS = {
+    "text": TextRenderer,
+    "jsonl": JsonLinesRenderer,
+    "csv": CsvRenderer,
+}
+
+
+def get_renderer(format_name):
+    """Returns a renderer for the named output format.
+
+    Args:
+        format_name: A key of RENDERERS, e.g. "text", "jsonl" or "csv".
+    Returns:
+        A renderer with write_summary and write_daily methods.
+    """
+    try:
+        return RENDERERS[format_name]()
+    except KeyError:
+        raise ValueError(f"unknown format {format_name!r} (expected one of {', '.join(sorted(RENDERERS))})")
+
+
+def render_summary(weather_data, out, format_name="text", percentiles=False, source=None):
+    """Writes the summary for the given weather data to a file object.
+
+    Args:
+        weather_data: An iterable of lists (or a WeatherTable, or a SummaryAccumulator).
+        out: A text file object (or io.StringIO) to write to.
+        format_name: The output format, a key of RENDERERS.
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs.
+            Ignored when weather_data is already a SummaryAccumulator.
+        source: optional name of the file the data came from, added to each
+            jsonl record and csv row so output from several files can be combined.
+    """
+    renderer = get_renderer(format_name)
+    if isinstance(weather_data, SummaryAccumulator):
+        accumulator = weather_data
+    else:
+        accumulator = SummaryAccumulator(percentiles).update_batch(weather_data)
+    if source is None:
+        renderer.write_summary(accumulator, out)
+    else:
+        renderer.write_summary(accumulator, out, source)
+
+
+def render_daily_summary(weather_data, out, format_name="text", source=None):
+    """Writes the daily summary for the given weather data to a file object, one day at a time.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        out: A text file object (or io.StringIO) to write to.
+        format_name: The output format, a key of RENDERERS.
+        source: optional name of the file the data came from, added to each
+            jsonl record and csv row.
+    Returns:
+        The number of days written.
+    """
+    renderer = get_renderer(format_name)
+    if source is None:
+        return renderer.write_daily(weather_data, out)
+    return renderer.write_daily(weather_data, out, source)
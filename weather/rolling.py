@@ -0,0 +1,127 @@
+"""Rolling-window lows, highs and averages."""
+from collections import deque
+
+
+class _MonotonicWindow:
+    """Tracks the minimum (or maximum) of the last `window` values pushed.
+
+    Values that can never be the answer again are dropped from the back of a
+    deque, so each push is amortised O(1). Equal values also drop the older
+    entry, so ties resolve to the *last* position, like find_min and find_max.
+    """
+    __slots__ = ("_window", "_entries", "_beats")
+
+    def __init__(self, window, largest):
+        self._window = window
+        self._entries = deque()
+        self._beats = float.__ge__ if largest else float.__le__
+
+    def push(self, value, position):
+        """Adds a value and returns the (value, position) extreme of the current window."""
+        entries = self._entries
+        while entries and self._beats(value, entries[-1][0]):
+            entries.pop()
+        entries.append((value, position))
+        if entries[0][1] <= position - self._window:
+            entries.popleft()
+        return entries[0]
+
+
+def _check_window(window):
+    """Raises a ValueError unless window is a positive whole number."""
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+
+def rolling_min(weather_data, window):
+    """Calculates the minimum of every run of `window` consecutive numbers.
+
+    Args:
+        weather_data: An iterable of numbers.
+        window: The number of values in each window, e.g. 7 for a 7-day low.
+    Yields:
+        A (minimum value, position) tuple for each full window, in order. Positions
+        index into weather_data and, as in find_min, ties give the *last* position.
+    """
+    _check_window(window)
+    tracker = _MonotonicWindow(window, largest=False)
+    for position, value in enumerate(weather_data):
+        extreme = tracker.push(float(value), position)
+        if position >= window - 1:
+            yield extreme
+
+
+def rolling_max(weather_data, window):
+    """Calculates the maximum of every run of `window` consecutive numbers.
+
+    Args:
+        weather_data: An iterable of numbers.
+        window: The number of values in each window, e.g. 7 for a 7-day high.
+    Yields:
+        A (maximum value, position) tuple for each full window, in order. Positions
+        index into weather_data and, as in find_max, ties give the *last* position.
+    """
+    _check_window(window)
+    tracker = _MonotonicWindow(window, largest=True)
+    for position, value in enumerate(weather_data):
+        extreme = tracker.push(float(value), position)
+        if position >= window - 1:
+            yield extreme
+
+
+def rolling_mean(weather_data, window):
+    """Calculates the mean of every run of `window` consecutive numbers.
+
+    A running total is kept, so each step costs O(1). Whole-degree readings give
+    exactly the same result as calculate_mean on each window.
+
+    Args:
+        weather_data: An iterable of numbers.
+        window: The number of values in each window, e.g. 30 for a 30-day average.
+    Yields:
+        A float for each full window, in order.
+    """
+    _check_window(window)
+    recent = deque()
+    total = 0.0
+    for value in weather_data:
+        value = float(value)
+        recent.append(value)
+        total += value
+        if len(recent) > window:
+            total -= recent.popleft()
+        if len(recent) == window:
+            yield total / window
+
+
+def iter_rolling_summary(weather_data, window):
+    """Calculates rolling lows, highs and averages over days of weather data.
+
+    Args:
+        weather_data: An iterable of lists, where each sublist represents a day of weather data.
+        window: The number of days in each window.
+    Yields:
+        For each full window, a tuple of the timestamp of its last day, the
+        (value, position) of the lowest minimum, the (value, position) of the
+        highest maximum, the average low and the average high.
+    """
+    _check_window(window)
+    lows = _MonotonicWindow(window, largest=False)
+    highs = _MonotonicWindow(window, largest=True)
+    recent = deque()
+    low_total = 0.0
+    high_total = 0.0
+    for position, day in enumerate(weather_data):
+        low = float(day[1])
+        high = float(day[2])
+        lowest = lows.push(low, position)
+        highest = highs.push(high, position)
+        recent.append((low, high))
+        low_total += low
+        high_total += high
+        if len(recent) > window:
+            old_low, old_high = recent.popleft()
+            low_total -= old_low
+            high_total -= old_high
+        if len(recent) == window:
+            yield (day[0], lowest, highest, low_total / window, high_total / window)
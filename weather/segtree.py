@@ -0,0 +1,244 @@
+"""A summary of weather data that can be corrected one day at a time."""
+from array import array
+from bisect import bisect_left, bisect_right
+
+from weather.core import SummaryAccumulator, WeatherTable, format_summary
+from weather.index import _day_number, _number
+
+
+class SummaryTree:
+    """Segment trees over the minimum and maximum columns of weather data.
+
+    Each node keeps the position of the lowest minimum and highest maximum
+    below it (the *last* one on ties, like find_min and find_max) and the
+    totals of both columns, so correcting a day and summarising any range
+    both take O(log n).
+
+    Like WeatherIndex, the data must be in chronological order, and ranges
+    are chosen by calendar date with both end dates included.
+    """
+
+    def __init__(self, weather_data):
+        """Builds the trees in O(n).
+
+        Args:
+            weather_data: A list of lists like load_data_from_csv returns, or a WeatherTable.
+        """
+        if isinstance(weather_data, WeatherTable):
+            self.timestamps = weather_data.timestamps
+            mins = list(weather_data.mins)
+            maxs = list(weather_data.maxs)
+        else:
+            self.timestamps = [day[0] for day in weather_data]
+            mins = [_number(day[1]) for day in weather_data]
+            maxs = [_number(day[2]) for day in weather_data]
+        self.days = array("q", map(_day_number, self.timestamps))
+        for i in range(1, len(self.days)):
+            if self.days[i] < self.days[i - 1]:
+                raise ValueError(f"weather data is not in date order at {self.timestamps[i]}")
+
+        n = len(mins)
+        size = 1
+        while size < n:
+            size *= 2
+        self._size = size
+        self.mins = mins
+        self.maxs = maxs
+        # Position -1 marks an empty node (a leaf past the end of the data).
+        self._min_at = [-1] * size + list(range(n)) + [-1] * (size - n)
+        self._max_at = list(self._min_at)
+        self._min_sums = [0] * size + mins + [0] * (size - n)
+        self._max_sums = [0] * size + maxs + [0] * (size - n)
+        for node in range(size - 1, 0, -1):
+            self._pull(node)
+
+    def __len__(self):
+        return len(self.mins)
+
+    def _lower(self, a, b):
+        """Returns whichever position has the lower minimum, the later one on ties."""
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        if self.mins[a] < self.mins[b]:
+            return a
+        if self.mins[b] < self.mins[a]:
+            return b
+        return a if a > b else b
+
+    def _higher(self, a, b):
+        """Returns whichever position has the higher maximum, the later one on ties."""
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        if self.maxs[a] > self.maxs[b]:
+            return a
+        if self.maxs[b] > self.maxs[a]:
+            return b
+        return a if a > b else b
+
+    def _pull(self, node):
+        """Recalculates a node from its two children."""
+        left = 2 * node
+        right = left + 1
+        self._min_at[node] = self._lower(self._min_at[left], self._min_at[right])
+        self._max_at[node] = self._higher(self._max_at[left], self._max_at[right])
+        self._min_sums[node] = self._min_sums[left] + self._min_sums[right]
+        self._max_sums[node] = self._max_sums[left] + self._max_sums[right]
+
+    def position(self, day):
+        """Returns the position of a day.
+
+        Args:
+            day: A position, or a date, datetime or ISO string naming exactly one day.
+        """
+        if isinstance(day, int):
+            if not 0 <= day < len(self):
+                raise IndexError(f"day {day} is out of range")
+            return day
+        number = _day_number(day)
+        first = bisect_left(self.days, number)
+        stop = bisect_right(self.days, number)
+        if stop - first != 1:
+            raise KeyError(f"{day} matches {stop - first} days")
+        return first
+
+    def update(self, day, new_min, new_max):
+        """Replaces the temperatures recorded for a day.
+
+        Args:
+            day: A position, or a date, datetime or ISO string naming exactly one day.
+            new_min: The corrected minimum temperature.
+            new_max: The corrected maximum temperature.
+        """
+        position = self.position(day)
+        self.mins[position] = _number(new_min)
+        self.maxs[position] = _number(new_max)
+        node = position + self._size
+        self._min_sums[node] = self.mins[position]
+        self._max_sums[node] = self.maxs[position]
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def __getitem__(self, position):
+        return [self.timestamps[position], self.mins[position], self.maxs[position]]
+
+    def to_list(self):
+        """Returns the corrected data as a list of lists, like load_data_from_csv."""
+        return [self[i] for i in range(len(self))]
+
+    def positions(self, start=None, end=None):
+        """Returns the positions covered by a date range.
+
+        Args:
+            start: The first date (a date, datetime or ISO string), or None for the first day.
+            end: The last date, included, or None for the last day.
+        Returns:
+            A (first, stop) pair, so the days are to_list()[first:stop].
+        """
+        first = 0 if start is None else bisect_left(self.days, _day_number(start))
+        stop = len(self.days) if end is None else bisect_right(self.days, _day_number(end))
+        return first, max(first, stop)
+
+    def _query(self, first, stop):
+        """Returns (min position, max position, min total, max total) for positions first to stop - 1."""
+        min_at = max_at = -1
+        min_total = max_total = 0
+        left = first + self._size
+        right = stop + self._size
+        while left < right:
+            if left & 1:
+                min_at = self._lower(min_at, self._min_at[left])
+                max_at = self._higher(max_at, self._max_at[left])
+                min_total += self._min_sums[left]
+                max_total += self._max_sums[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                min_at = self._lower(min_at, self._min_at[right])
+                max_at = self._higher(max_at, self._max_at[right])
+                min_total += self._min_sums[right]
+                max_total += self._max_sums[right]
+            left //= 2
+            right //= 2
+        return min_at, max_at, min_total, max_total
+
+    def range_min(self, start=None, end=None):
+        """Finds the lowest minimum temperature in a date range.
+
+        Returns:
+            The minimum value and its position in the whole data, like find_min,
+            or an empty tuple if no days fall in the range.
+        """
+        first, stop = self.positions(start, end)
+        if first == stop:
+            return ()
+        position = self._query(first, stop)[0]
+        return (float(self.mins[position]), position)
+
+    def range_max(self, start=None, end=None):
+        """Finds the highest maximum temperature in a date range.
+
+        Returns:
+            The maximum value and its position in the whole data, like find_max,
+            or an empty tuple if no days fall in the range.
+        """
+        first, stop = self.positions(start, end)
+        if first == stop:
+            return ()
+        position = self._query(first, stop)[1]
+        return (float(self.maxs[position]), position)
+
+    def range_mean(self, start=None, end=None):
+        """Calculates the average minimum and maximum temperatures in a date range.
+
+        Returns:
+            A (mean low, mean high) pair, or an empty tuple if no days fall in the range.
+        """
+        first, stop = self.positions(start, end)
+        if first == stop:
+            return ()
+        _, _, min_total, max_total = self._query(first, stop)
+        return (min_total / (stop - first), max_total / (stop - first))
+
+    def range_accumulator(self, start=None, end=None):
+        """Returns a SummaryAccumulator for a date range, with positions
+            counted from the first day of the range.
+        """
+        first, stop = self.positions(start, end)
+        accumulator = SummaryAccumulator()
+        if first == stop:
+            return accumulator
+        min_at, max_at, min_total, max_total = self._query(first, stop)
+        accumulator.count = stop - first
+        accumulator.min_value = float(self.mins[min_at])
+        accumulator.min_position = min_at - first
+        accumulator.min_timestamp = self.timestamps[min_at]
+        accumulator.max_value = float(self.maxs[max_at])
+        accumulator.max_position = max_at - first
+        accumulator.max_timestamp = self.timestamps[max_at]
+        accumulator.min_total = float(min_total)
+        accumulator.max_total = float(max_total)
+        return accumulator
+
+    def summarize_range(self, start=None, end=None):
+        """Outputs a summary for a date range of the corrected data.
+
+        For whole-number temperatures the text is identical to generate_summary
+        on the same days; otherwise the averages are added up in a different
+        order, which can change their last decimal place in rare cases.
+
+        Args:
+            start: The first date (a date, datetime or ISO string), or None for the first day.
+            end: The last date, included, or None for the last day.
+        Returns:
+            A string containing the summary information.
+        """
+        return format_summary(self.range_accumulator(start, end))
+
+    def __repr__(self):
+        return f"<SummaryTree of {len(self)} days>"
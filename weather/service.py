@@ -0,0 +1,259 @@
+"""An asyncio HTTP service that returns weather summaries."""
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from weather.core import _open_binary, _percentile, _read_rows
+from weather.render import get_renderer, render_daily_summary, render_summary
+
+
+class ResponseCache:
+    """A least-recently-used cache of encoded responses, bounded by total size.
+
+    Keys are content hashes, so identical inputs share an entry however they
+    were sent. Counts hits, misses and evictions like DateCache.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Returns the cached response for key, or None."""
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key, response):
+        """Stores a response, evicting the least recently used ones to stay in bounds."""
+        if len(response) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = response
+        self._bytes += len(response)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def info(self):
+        """Returns the cache statistics as a dictionary."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def _render_csv_bytes(kind, content, format_name="text"):
+    """Renders a summary or daily summary from the raw bytes of a (possibly gzip, bz2 or xz compressed) csv file."""
+    rows = _read_rows(io.TextIOWrapper(_open_binary(io.BytesIO(content)), encoding="utf-8", newline=""))
+    rendered = io.StringIO()
+    if kind == "daily-summary":
+        render_daily_summary(rows, rendered, format_name)
+    else:
+        render_summary(rows, rendered, format_name)
+    return rendered.getvalue().encode("utf-8")
+
+
+def _read_file_bytes(path, max_bytes):
+    """Returns the contents of a file, refusing files larger than max_bytes with a 413."""
+    with open(path, 'rb') as data:
+        if os.fstat(data.fileno()).st_size > max_bytes:
+            raise _HTTPError(413, "file is too large")
+        content = data.read(max_bytes + 1)
+    if len(content) > max_bytes:
+        raise _HTTPError(413, "file is too large")
+    return content
+
+
+def _cache_key(kind, format_name, content):
+    """Hashes a request's route, format and csv content into a response cache key."""
+    digest = hashlib.sha256(f"{kind}\0{format_name}\0".encode("ascii"))
+    digest.update(content)
+    return digest.digest()
+
+
+class _HTTPError(Exception):
+    """An error that is sent back to the client with the given status."""
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+_HTTP_REASONS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+                 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class SummaryService:
+    """A small HTTP service that returns weather summaries.
+
+    POST /summary or /daily-summary with a csv body, or with ?path=<file> to
+    summarise a file under data_dir. Add ?format=jsonl or ?format=csv for
+    machine-readable output. Responses are cached by a hash of the csv
+    content, and GET /metrics reports request latency and cache hit rate.
+    Summaries are computed in an executor so the event loop is never blocked.
+    """
+
+    def __init__(self, executor=None, cache_bytes=64 * 1024 * 1024, data_dir=None,
+                 max_body_bytes=256 * 1024 * 1024, latency_samples=10000):
+        self.executor = executor
+        self.cache = ResponseCache(cache_bytes)
+        self.data_dir = os.path.realpath(data_dir) if data_dir else None
+        self.max_body_bytes = max_body_bytes
+        self.requests = 0
+        self.errors = 0
+        self._latencies = deque(maxlen=latency_samples)
+
+    def metrics(self):
+        """Returns the request, latency and cache metrics as a dictionary."""
+        latencies = sorted(self._latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_ms": {
+                "mean": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+                "p50": _percentile(latencies, 0.50) * 1000,
+                "p99": _percentile(latencies, 0.99) * 1000,
+            },
+            "cache": self.cache.info(),
+        }
+
+    def _resolve_path(self, path):
+        """Returns the real path of a requested file, refusing anything outside data_dir."""
+        if self.data_dir is None:
+            raise _HTTPError(403, "file paths are not enabled (start the service with a data directory)")
+        resolved = os.path.realpath(os.path.join(self.data_dir, path))
+        if os.path.commonpath([resolved, self.data_dir]) != self.data_dir:
+            raise _HTTPError(403, "path is outside the data directory")
+        return resolved
+
+    async def _summarize(self, kind, format_name, query, body):
+        """Returns the rendered summary for a request, using the cache when possible.
+
+        Files are held to the same max_body_bytes limit as request bodies, and
+        reading and hashing happen off the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if "path" in query:
+            try:
+                body = await loop.run_in_executor(None, _read_file_bytes, self._resolve_path(query["path"][0]),
+                                                  self.max_body_bytes)
+            except OSError as error:
+                raise _HTTPError(404, str(error))
+        key = await loop.run_in_executor(None, _cache_key, kind, format_name, body)
+        response = self.cache.get(key)
+        if response is None:
+            try:
+                response = await loop.run_in_executor(self.executor, _render_csv_bytes, kind, body, format_name)
+            except (ValueError, IndexError, csv.Error) as error:
+                raise _HTTPError(400, f"could not summarise csv: {error}")
+            self.cache.put(key, response)
+        return response
+
+    async def _respond(self, method, target, body):
+        """Routes a request, returning (status, content type, body bytes)."""
+        url = urlsplit(target)
+        route = url.path.strip("/")
+        if route == "metrics":
+            if method != "GET":
+                raise _HTTPError(405, "use GET")
+            return 200, "application/json", json.dumps(self.metrics()).encode("utf-8")
+        if route in ("summary", "daily-summary"):
+            if method != "POST":
+                raise _HTTPError(405, "use POST")
+            query = parse_qs(url.query)
+            format_name = query.get("format", ["text"])[0]
+            try:
+                renderer = get_renderer(format_name)
+            except ValueError as error:
+                raise _HTTPError(400, str(error))
+            response = await self._summarize(route, format_name, query, body)
+            return 200, renderer.content_type, response
+        raise _HTTPError(404, "unknown path")
+
+    async def handle(self, reader, writer):
+        """Serves a single HTTP/1.1 request on a connection."""
+        started = time.perf_counter()
+        try:
+            try:
+                request_line = (await reader.readline()).decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if len(request_line) != 3:
+                    raise _HTTPError(400, "malformed request line")
+                length = int(headers.get("content-length", "0"))
+                if length > self.max_body_bytes:
+                    raise _HTTPError(413, "request body is too large")
+                body = await reader.readexactly(length)
+                status, content_type, payload = await self._respond(request_line[0], request_line[1], body)
+            except _HTTPError as error:
+                status, content_type, payload = error.status, "text/plain; charset=utf-8", f"{error}\n".encode("utf-8")
+            except (ValueError, asyncio.IncompleteReadError) as error:
+                status, content_type, payload = 400, "text/plain; charset=utf-8", f"{error}\n".encode("utf-8")
+            except Exception as error:
+                # e.g. a worker process that died; the client still gets a response.
+                status, content_type = 500, "text/plain; charset=utf-8"
+                payload = f"internal error: {type(error).__name__}: {error}\n".encode("utf-8")
+            self.requests += 1
+            if status >= 400:
+                self.errors += 1
+            writer.write(f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}\r\n"
+                         f"Content-Type: {content_type}\r\n"
+                         f"Content-Length: {len(payload)}\r\n"
+                         f"Connection: close\r\n\r\n".encode("latin-1") + payload)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._latencies.append(time.perf_counter() - started)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """Starts listening and returns the asyncio Server."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(host="127.0.0.1", port=8080, workers=None, cache_bytes=64 * 1024 * 1024, data_dir=None):
+    """Runs a SummaryService until cancelled.
+
+    Args:
+        host: The address to listen on.
+        port: The port to listen on.
+        workers: The number of worker processes. Defaults to the number of CPUs.
+        cache_bytes: The largest total size of cached responses.
+        data_dir: A directory whose files may be summarised by path, or None.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        service = SummaryService(executor, cache_bytes=cache_bytes, data_dir=data_dir)
+        server = await service.start(host, port)
+        async with server:
+            await server.serve_forever()
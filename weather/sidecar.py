@@ -0,0 +1,135 @@
+"""Binary sidecar files that let load_table_from_csv skip parsing."""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from itertools import accumulate
+from operator import add
+
+from weather.core import WeatherTable
+
+# Binary sidecar files written next to csv files by load_table_from_csv.
+SIDECAR_SUFFIX = ".wtbl"
+_SIDECAR_MAGIC = b"WTBL"
+_SIDECAR_VERSION = 1
+_SIDECAR_PREAMBLE = struct.Struct("<4sHI")
+
+# Filesystems may only store modification times to the nearest 2 seconds (FAT),
+# second (ext3, some NFS servers) or clock tick. A csv file modified this close
+# to when its sidecar was built could be edited again without its mtime
+# changing, so, like git's "racy" index entries, it is always re-hashed.
+_RACY_NS = 2_000_000_000
+
+def sidecar_path(csv_file):
+    """Returns the path of the binary sidecar for a csv file."""
+    return os.fspath(csv_file) + SIDECAR_SUFFIX
+
+
+def _file_sha256(path):
+    """Returns the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as data:
+        for block in iter(lambda: data.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sidecar_header(csv_file, stat, content_hash, rows, text_bytes):
+    """Describes the source file that a sidecar was built from."""
+    return {
+        "source": os.path.abspath(csv_file),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": content_hash,
+        "rows": rows,
+        "text_bytes": text_bytes,
+        "byteorder": sys.byteorder,
+        "built_ns": time.time_ns(),
+    }
+
+
+def _write_sidecar(csv_file, table, stat, content_hash=None):
+    """Writes a table to its sidecar file, replacing any older sidecar atomically.
+
+    The layout is a fixed preamble, a JSON header padded to 8 bytes, the start,
+    end, min and max columns as native 64-bit integers, then the timestamp text.
+    Failures to write (e.g. a read-only directory) are ignored. The csv file is
+    hashed unless its content_hash is already known.
+    """
+    rows = len(table)
+    timestamps = [table._text[table._starts[i]:table._ends[i]] for i in range(rows)]
+    lengths = list(map(len, timestamps))
+    text_bytes = sum(lengths)
+    if content_hash is None:
+        content_hash = _file_sha256(csv_file)
+    header = _sidecar_header(csv_file, stat, content_hash, rows, text_bytes)
+    encoded = json.dumps(header).encode("utf-8")
+    header_end = _SIDECAR_PREAMBLE.size + len(encoded)
+    padding = -header_end % 8
+    text_offset = header_end + padding + 4 * 8 * rows
+    starts = array("q", accumulate(lengths, initial=text_offset))
+    starts.pop()
+    ends = array("q", map(add, starts, lengths))
+
+    path = sidecar_path(csv_file)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, 'wb') as sidecar:
+            sidecar.write(_SIDECAR_PREAMBLE.pack(_SIDECAR_MAGIC, _SIDECAR_VERSION, len(encoded)))
+            sidecar.write(encoded)
+            sidecar.write(b"\0" * padding)
+            for column in (starts, ends, array("q", table.mins), array("q", table.maxs)):
+                sidecar.write(column.tobytes())
+            sidecar.write(b"".join(timestamps))
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+def _read_sidecar(csv_file, stat):
+    """Maps a table from its sidecar file, or returns None if the sidecar is
+        missing, corrupt or out of date.
+    """
+    try:
+        with open(sidecar_path(csv_file), 'rb') as sidecar:
+            mapping = mmap.mmap(sidecar.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, version, header_size = _SIDECAR_PREAMBLE.unpack_from(mapping)
+        if magic != _SIDECAR_MAGIC or version != _SIDECAR_VERSION:
+            raise ValueError("not a weather sidecar")
+        header_end = _SIDECAR_PREAMBLE.size + header_size
+        header = json.loads(bytes(mapping[_SIDECAR_PREAMBLE.size:header_end]))
+        rows = header["rows"]
+        column_offset = header_end + (-header_end % 8)
+        text_offset = column_offset + 4 * 8 * rows
+        if (header["source"] != os.path.abspath(csv_file) or header["size"] != stat.st_size
+                or header["byteorder"] != sys.byteorder
+                or text_offset + header["text_bytes"] != len(mapping)):
+            raise ValueError("sidecar does not match its csv file")
+        touched = header["mtime_ns"] != stat.st_mtime_ns
+        racy = header["mtime_ns"] + _RACY_NS >= header.get("built_ns", 0)
+        if (touched or racy) and header["sha256"] != _file_sha256(csv_file):
+            raise ValueError("csv file has changed")
+    except (ValueError, TypeError, KeyError, struct.error):
+        mapping.close()
+        return None
+
+    view = memoryview(mapping)
+    columns = [view[column_offset + 8 * rows * i:column_offset + 8 * rows * (i + 1)].cast("q")
+               for i in range(4)]
+    table = WeatherTable._from_columns(mapping, *columns)
+    if touched or (racy and time.time_ns() > stat.st_mtime_ns + _RACY_NS):
+        # Only the modification time changed (e.g. touch, or a copy), or the
+        # sidecar was built too soon after the csv file was written. Record the
+        # new mtime and build time so later loads do not hash the whole csv file again.
+        _write_sidecar(csv_file, table, stat, header["sha256"])
+    return table
@@ -0,0 +1,233 @@
+"""A mergeable streaming quantile sketch for temperatures."""
+import math
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+
+
+class QuantileSketch:
+    """Estimates quantiles of a stream of numbers in bounded memory.
+
+    While the stream holds at most exact_limit distinct values it is kept as
+    a count of each value, so quantiles are exact (whole-degree temperatures
+    never get past this). After that it becomes a merging t-digest of about
+    compression centroids, which is most accurate near the tails. Sketches
+    of different chunks of data can be combined with merge.
+
+    Quantiles interpolate linearly between the two nearest ranks, like
+    statistics.quantiles(method="inclusive") and NumPy's default.
+    """
+    __slots__ = ("compression", "exact_limit", "count", "minimum", "maximum",
+                 "_counts", "_centroids", "_buffer")
+
+    def __init__(self, compression=100, exact_limit=2048):
+        if compression < 10:
+            raise ValueError("compression must be at least 10")
+        self.compression = compression
+        self.exact_limit = exact_limit
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self._counts = {}
+        self._centroids = None
+        self._buffer = []
+
+    @property
+    def exact(self):
+        """True while quantiles are still calculated exactly."""
+        return self._counts is not None
+
+    def add(self, value):
+        """Adds a single number to the sketch."""
+        if self.count == 0 or value < self.minimum:
+            self.minimum = value
+        if self.count == 0 or value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        counts = self._counts
+        if counts is None:
+            self._buffer.append(value)
+            if len(self._buffer) >= 10 * self.compression:
+                self._flush()
+        elif value in counts:
+            counts[value] += 1
+        else:
+            counts[value] = 1
+            if len(counts) > self.exact_limit:
+                self._start_digest()
+
+    def add_many(self, values):
+        """Adds many numbers at once, e.g. a whole column of a WeatherTable."""
+        self._add_counts(Counter(values))
+
+    def _add_counts(self, counts):
+        """Adds a dictionary of {value: number of occurrences}."""
+        if not counts:
+            return
+        low = min(counts)
+        high = max(counts)
+        if self.count == 0 or low < self.minimum:
+            self.minimum = low
+        if self.count == 0 or high > self.maximum:
+            self.maximum = high
+        self.count += sum(counts.values())
+        if self._counts is None:
+            self._flush(sorted(counts.items()))
+            return
+        own = self._counts
+        for value, number in counts.items():
+            own[value] = own.get(value, 0) + number
+        if len(own) > self.exact_limit:
+            self._start_digest()
+
+    def _start_digest(self):
+        """Switches from exact counts to centroids."""
+        items = sorted(self._counts.items())
+        self._counts = None
+        self._centroids = []
+        self._flush(items)
+
+    def _flush(self, items=()):
+        """Merges the buffered values (and any extra sorted (mean, weight)
+            pairs) into the centroids.
+        """
+        if self._buffer:
+            items = sorted(list(items) + list(Counter(self._buffer).items()))
+            self._buffer = []
+        if items:
+            self._centroids = self._compress(sorted(self._centroids + list(items)))
+
+    def _compress(self, items):
+        """Merges sorted (mean, weight) pairs so that no centroid covers more of
+            the distribution than the k1 scale function allows.
+        """
+        total = sum(weight for _, weight in items)
+        scale = self.compression / (2 * math.pi)
+        result = []
+        mean, weight = items[0]
+        done = 0
+        limit = self._q_limit(0.0, scale)
+        for next_mean, next_weight in items[1:]:
+            if (done + weight + next_weight) / total <= limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                result.append((mean, weight))
+                done += weight
+                limit = self._q_limit(done / total, scale)
+                mean, weight = next_mean, next_weight
+        result.append((mean, weight))
+        return result
+
+    @staticmethod
+    def _q_limit(q, scale):
+        """Returns the largest quantile a centroid starting at q may reach."""
+        k = scale * math.asin(2 * q - 1) + 1
+        if k >= scale * math.pi / 2:
+            return 1.0
+        return (math.sin(k / scale) + 1) / 2
+
+    def merge(self, other):
+        """Adds everything summarised by another sketch.
+
+        Args:
+            other: A QuantileSketch.
+        Returns:
+            The sketch, so calls can be chained.
+        """
+        if other.count == 0:
+            return self
+        if other._counts is not None:
+            self._add_counts(other._counts)
+            return self
+        other._flush()
+        if self._counts is not None:
+            self._start_digest()
+        else:
+            self._flush()
+        if self.count == 0 or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.count == 0 or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self.count += other.count
+        self._centroids = self._compress(sorted(self._centroids + other._centroids))
+        return self
+
+    def quantile(self, q):
+        """Returns the (estimated) q-th quantile.
+
+        Args:
+            q: A fraction between 0 and 1, e.g. 0.5 for the median.
+        Returns:
+            The quantile, or None if the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        position = q * (self.count - 1)
+        if self._counts is not None:
+            values = sorted(self._counts)
+            ends = list(accumulate(self._counts[value] for value in values))
+            lower = math.floor(position)
+            below = values[bisect_right(ends, lower)]
+            above = values[bisect_right(ends, min(lower + 1, self.count - 1))]
+            return below + (above - below) * (position - lower)
+
+        self._flush()
+        # Each centroid sits at the middle of the ranks it covers; the minimum
+        # and maximum sit at the first and last rank.
+        target = position + 0.5
+        previous_mean, previous_centre = self.minimum, 0.5
+        done = 0
+        for mean, weight in self._centroids:
+            centre = done + weight / 2
+            if target <= centre:
+                if centre == previous_centre:
+                    return mean
+                return previous_mean + (mean - previous_mean) * (target - previous_centre) / (centre - previous_centre)
+            previous_mean, previous_centre = mean, centre
+            done += weight
+        last_centre = self.count - 0.5
+        if last_centre <= previous_centre:
+            return self.maximum
+        return previous_mean + (self.maximum - previous_mean) * (target - previous_centre) / (last_centre - previous_centre)
+
+    def copy(self):
+        """Returns an independent copy of the sketch."""
+        return QuantileSketch.from_dict(self.to_dict())
+
+    def to_dict(self):
+        """Returns the sketch state as a JSON-serialisable dictionary."""
+        if self._counts is None:
+            self._flush()
+        return {
+            "compression": self.compression,
+            "exact_limit": self.exact_limit,
+            "count": self.count,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "counts": None if self._counts is None else sorted(self._counts.items()),
+            "centroids": self._centroids,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuilds a sketch from the output of to_dict."""
+        sketch = cls(state["compression"], state["exact_limit"])
+        sketch.count = state["count"]
+        sketch.minimum = state["minimum"]
+        sketch.maximum = state["maximum"]
+        if state["counts"] is None:
+            sketch._counts = None
+            sketch._centroids = [tuple(centroid) for centroid in state["centroids"]]
+        else:
+            sketch._counts = {value: number for value, number in state["counts"]}
+        return sketch
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        mode = "exact" if self._counts is not None else f"{len(self._centroids)} centroids"
+        return f"<QuantileSketch of {self.count} values, {mode}>"
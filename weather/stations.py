@@ -0,0 +1,240 @@
+"""Loading and summarising csv files that interleave several weather stations."""
+import csv
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from weather.core import (SummaryAccumulator, WeatherTable, csv_compression, format_summary, generate_daily_summary,
+                          open_csv, write_daily_summary)
+from weather.parallel import SHARD_MIN_BYTES, _iter_byte_range, _shard_boundaries
+
+
+def _station_layout(header, station_column):
+    """Works out which columns hold the station, date, min and max.
+
+    The date, min and max columns are found by name when the header has them,
+    otherwise they are taken to be the first three columns other than the station.
+
+    Returns:
+        The (station, date, min, max) column indexes.
+    """
+    names = [name.strip() for name in header]
+    if station_column not in names:
+        raise ValueError(f"the csv header has no {station_column!r} column: {','.join(header)}")
+    station = names.index(station_column)
+    if all(name in names for name in ("date", "min", "max")):
+        return station, names.index("date"), names.index("min"), names.index("max")
+    others = [i for i in range(len(names)) if i != station]
+    if len(others) < 3:
+        raise ValueError(f"the csv header needs a date, min and max column: {','.join(header)}")
+    return station, others[0], others[1], others[2]
+
+
+def _read_station_rows(lines, layout):
+    """Yields (station, [date, min, max]) from csv lines without a header, skipping blank lines."""
+    station, date, low, high = layout
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        yield row[station], [row[date], int(row[low]), int(row[high])]
+
+
+def _read_layout(csv_file, station_column):
+    """Reads the header of a multi-station csv file, returning its column layout (or None if empty)."""
+    with open_csv(csv_file) as data:
+        header = next(csv.reader(data), None)
+    if header is None:
+        return None
+    return _station_layout(header, station_column)
+
+
+def iter_station_rows(csv_file, station_column="station"):
+    """Reads a multi-station csv file lazily.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        station_column: the name of the column holding the station id.
+    Yields:
+        (station, [date, min, max]) for each (non-empty) line in the csv file.
+    """
+    with open_csv(csv_file) as data:
+        header = next(csv.reader(data), None)
+        if header is None:
+            return
+        yield from _read_station_rows(data, _station_layout(header, station_column))
+
+
+def load_stations_from_csv(csv_file, station_column="station"):
+    """Reads a multi-station csv file into one WeatherTable per station, in one pass.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        station_column: the name of the column holding the station id.
+    Returns:
+        A dictionary mapping each station id to a WeatherTable of its rows, in
+        the order the stations first appear.
+    """
+    tables = {}
+    for station, (date, min_temp, max_temp) in iter_station_rows(csv_file, station_column):
+        table = tables.get(station)
+        if table is None:
+            table = tables[station] = WeatherTable()
+        table.append(date, min_temp, max_temp)
+    return tables
+
+
+def _summarize_station_lines(lines, layout, percentiles):
+    """Returns {station: SummaryAccumulator} for some csv lines."""
+    accumulators = {}
+    for station, row in _read_station_rows(lines, layout):
+        accumulator = accumulators.get(station)
+        if accumulator is None:
+            accumulator = accumulators[station] = SummaryAccumulator(percentiles)
+        accumulator.update(row)
+    return accumulators
+
+
+def _summarize_station_shard(csv_file, start, end, layout, percentiles=False):
+    """Summarises each station in the rows of a csv file between two line-aligned byte offsets."""
+    with open(csv_file, 'rb') as data:
+        data.seek(start)
+        return _summarize_station_lines(_iter_byte_range(data, end - start), layout, percentiles)
+
+
+def summarize_stations(csv_file, station_column="station", workers=1, percentiles=False,
+                       min_shard_bytes=SHARD_MIN_BYTES):
+    """Summarises every station in a multi-station csv file in one pass.
+
+    Only a running summary is kept per station, so memory does not grow with
+    the file. With several workers the file is split into line-aligned byte
+    ranges like summarize_csv, and each station's partial summaries are merged
+    in file order. gzip, bz2 and xz files are read in a single streaming pass.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        station_column: the name of the column holding the station id.
+        workers: the number of processes to use.
+        percentiles: whether each summary also tracks percentiles.
+        min_shard_bytes: the smallest byte range worth giving to a process.
+    Returns:
+        A dictionary mapping each station id to its SummaryAccumulator, sorted by station id.
+    """
+    layout = _read_layout(csv_file, station_column)
+    if layout is None:
+        return {}
+    if csv_compression(csv_file) is not None:
+        with open_csv(csv_file) as data:
+            next(data)
+            return dict(sorted(_summarize_station_lines(data, layout, percentiles).items()))
+    shards = max(1, min(workers, os.path.getsize(csv_file) // max(1, min_shard_bytes)))
+    boundaries = _shard_boundaries(csv_file, shards)
+    if len(boundaries) <= 2:
+        accumulators = _summarize_station_shard(csv_file, boundaries[0], boundaries[-1], layout, percentiles)
+    else:
+        accumulators = {}
+        with ProcessPoolExecutor(max_workers=len(boundaries) - 1) as executor:
+            partials = executor.map(_summarize_station_shard, repeat(csv_file), boundaries[:-1],
+                                    boundaries[1:], repeat(layout), repeat(percentiles))
+            for partial in partials:
+                for station, accumulator in partial.items():
+                    if station in accumulators:
+                        accumulators[station].merge(accumulator)
+                    else:
+                        accumulators[station] = accumulator
+    return dict(sorted(accumulators.items()))
+
+
+def _heading(station):
+    return f"==== Station {station} ====\n"
+
+
+def generate_station_summary(csv_file, station_column="station", daily=False, workers=1, percentiles=False):
+    """Outputs the summary (or daily summary) of every station in a multi-station csv file.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        station_column: the name of the column holding the station id.
+        daily: whether to output daily summaries instead of overviews.
+        workers: the number of processes to use for overviews.
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs to overviews.
+    Returns:
+        A string with a "==== Station <id> ====" heading before the summary of
+        each station, in order of station id.
+    """
+    blocks = []
+    if daily:
+        tables = load_stations_from_csv(csv_file, station_column)
+        for station in sorted(tables):
+            blocks.append(_heading(station) + generate_daily_summary(tables[station]))
+    else:
+        for station, accumulator in summarize_stations(csv_file, station_column, workers, percentiles).items():
+            blocks.append(_heading(station) + format_summary(accumulator) + "\n")
+    return "".join(blocks)
+
+
+def station_file_name(station, daily=False):
+    """Returns the file name write_station_summaries uses for a station."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", station).lstrip(".") or "_"
+    return safe + ("_daily_summary.txt" if daily else "_summary.txt")
+
+
+def write_station_summaries(csv_file, output_dir, station_column="station", daily=False,
+                            workers=1, percentiles=False, days_per_write=512):
+    """Writes one summary file per station of a multi-station csv file, reading it once.
+
+    Daily summaries are streamed: each station's days are buffered and
+    appended to its file days_per_write at a time, so the whole file is never
+    held in memory.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        output_dir: the directory to write to (created if needed).
+        station_column: the name of the column holding the station id.
+        daily: whether to write daily summaries instead of overviews.
+        workers: the number of processes to use for overviews.
+        percentiles: whether to add the median, 5th and 95th percentile lows and highs to overviews.
+        days_per_write: how many days to buffer per station before writing them.
+    Returns:
+        A dictionary mapping each station id to the path written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {}
+    owners = {}
+
+    def path_for(station):
+        path = paths.get(station)
+        if path is None:
+            name = station_file_name(station, daily)
+            if name in owners:
+                raise ValueError(f"stations {owners[name]!r} and {station!r} would both be written to {name}")
+            owners[name] = station
+            path = paths[station] = os.path.join(output_dir, name)
+        return path
+
+    if not daily:
+        for station, accumulator in summarize_stations(csv_file, station_column, workers, percentiles).items():
+            with open(path_for(station), "w", encoding="utf8") as summary_file:
+                summary_file.write(format_summary(accumulator))
+        return paths
+
+    buffers = {}
+
+    def flush(station, mode):
+        with open(path_for(station), mode, encoding="utf8") as summary_file:
+            write_daily_summary(buffers[station], summary_file, days_per_write)
+        buffers[station] = []
+
+    started = set()
+    for station, row in iter_station_rows(csv_file, station_column):
+        buffer = buffers.get(station)
+        if buffer is None:
+            buffer = buffers[station] = []
+        buffer.append(row)
+        if len(buffer) >= days_per_write:
+            flush(station, "a" if station in started else "w")
+            started.add(station)
+    for station in buffers:
+        if buffers[station] or station not in started:
+            flush(station, "a" if station in started else "w")
+    return dict(sorted(paths.items()))